@@ -1,23 +1,31 @@
+import hashlib
+import html
+import heapq
+from collections import Counter
 import streamlit as st
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
 from utils import (
-    extract_text_from_pdf, extract_skills, calculate_match,
+    extract_pdf_text, MAX_PDF_PAGES, MAX_PDF_CHARS,
+    extract_skills, extract_skills_batch, calculate_match_with_technical,
     extract_experience, extract_education, extract_keywords,
     categorize_skills, analyze_resume_quality, get_improvement_suggestions,
     get_skill_gaps, match_certifications, predict_salary,
     get_interview_readiness_score, get_career_progression_path,
-    calculate_weighted_match_score, match_job_profile, extract_contact_info,
-    detect_job_role, is_technical_skill, filter_technical_skills,
-    extract_job_requirements, normalize_skill,
+    calculate_weighted_match_score, match_job_profile, analyze_resume,
+    detect_job_role, is_technical_skill,
+    extract_job_requirements, normalize_skill, ALL_INDUSTRY_SKILLS, TECH_SOFT_SKILLS,
+    score_job_profiles, JOB_PROFILE_ROLES, JOB_PROFILE_RECORDS, ELIGIBILITY_COLORS,
     get_keyword_density, get_ats_checklist, get_readability_stats,
     get_action_verb_suggestions, get_tailoring_phrases,
     get_interview_questions, get_cover_letter_bullets,
-    get_ideal_candidate_snapshot, generate_report_text
+    get_ideal_candidate_snapshot, generate_report_text, score_resume_quality
+)
+from industry_data import (
+    JOB_PROFILES, INDUSTRY_SALARY_DATA, INDUSTRY_SALARY_RANGES, INDUSTRY_INSIGHTS,
+    CAREER_MILESTONES, ROADMAP_ROLE_SKILLS,
+    LEARNING_RESOURCES, NEGOTIATION_CHECKLIST, HOT_SKILLS_BY_INDUSTRY, JOB_MARKET_STATS
 )
-from industry_data import JOB_PROFILES, INDUSTRY_SALARY_DATA, TECHNICAL_SKILLS, SOFT_SKILLS, CREATIVE_SKILLS
 
 # Page Configuration
 st.set_page_config(
@@ -27,7 +35,7 @@ st.set_page_config(
 )
 
 # Custom CSS with enhanced styling
-st.markdown("""
+_CSS = """
 <style>
 .big-font {
     font-size: 40px !important;
@@ -82,8 +90,34 @@ st.markdown("""
 [data-testid="stMetricDelta"], [data-testid="stMetricValue"] {
     word-break: break-word;
 }
+.skill-chips {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 8px;
+    margin: 4px 0 16px 0;
+}
+.skill-chip {
+    padding: 8px 14px;
+    border-radius: 8px;
+    word-break: break-word;
+}
+.skill-chip-info {
+    background: rgba(28, 131, 225, 0.1);
+    color: rgb(0, 66, 128);
+}
+.skill-chip-success {
+    background: rgba(33, 195, 84, 0.1);
+    color: rgb(23, 114, 51);
+}
+.skill-chip-error {
+    background: rgba(255, 43, 43, 0.09);
+    color: rgb(125, 53, 59);
+}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Sidebar Configuration
 st.sidebar.title("⚙️ Smart Resume Analyzer PRO v3.0")
@@ -98,12 +132,326 @@ st.sidebar.divider()
 st.sidebar.markdown("**Features:**")
 st.sidebar.markdown("✓ AI skill matching & weighted score\n✓ Keyword density & ATS checklist\n✓ Salary & career path\n✓ Certifications & skill gaps\n✓ Interview Qs & readiness\n✓ Resume tailoring & cover letter bullets\n✓ Readability & action verbs")
 
-# Default skills list
-default_skills = [
+# Default skills list (a tuple so it doubles as a stable cache key for the skill matchers)
+default_skills = (
     "Python", "SQL", "Machine Learning", "Data Analysis", "Java", "C++",
     "Communication", "Excel", "Leadership", "AWS", "React", "Node.js",
     "Docker", "Git", "Agile", "REST API", "JavaScript", "TypeScript"
-]
+)
+
+# ==========================================
+# CACHED EXTRACTION
+# ==========================================
+# Streamlit reruns the whole script on every widget change, so the parsers are
+# memoized on a BLAKE2b digest of the uploaded bytes and on the extracted text.
+# Resume text is personal data, so the caches stay in memory and are never written
+# to disk. Every cache is LRU-bounded so a long-running server does not grow without limit.
+_CACHE_MAX_ENTRIES = 64
+
+
+def _upload_digest(uploaded_file):
+    # Hash the upload's buffer in place; getvalue() would copy the whole file first
+    with uploaded_file.getbuffer() as view:
+        return hashlib.blake2b(view, digest_size=16).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_extract_pdf(pdf_digest, _pdf_file):
+    # _pdf_file is excluded from the cache key and read in place by PdfReader
+    return extract_pdf_text(_pdf_file)
+
+
+def _cached_extract_text(pdf_digest, _pdf_file):
+    return _cached_extract_pdf(pdf_digest, _pdf_file)[0]
+
+
+@st.cache_resource(show_spinner=False)
+def _pdf_text_store():
+    # Per-file (text, truncated) results behind the batch cache, so adding one resume to a batch only parses that file
+    return {}
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_extract_pdfs(pdf_digests, _pdf_files):
+    store = _pdf_text_store()
+    results = {digest: store[digest] for digest in pdf_digests if digest in store}
+    todo = [(digest, pdf_file) for digest, pdf_file in zip(pdf_digests, _pdf_files) if digest not in results]
+    # Each file is capped at MAX_PDF_PAGES pages, so parsing in-process stays cheap
+    parsed = [extract_pdf_text(pdf_file) for _, pdf_file in todo]
+    for (digest, _), result in zip(todo, parsed):
+        results[digest] = store[digest] = result
+    while len(store) > _CACHE_MAX_ENTRIES * 4:
+        store.pop(next(iter(store)), None)
+    return [results[digest] for digest in pdf_digests]
+
+
+def _parse_custom_skills(custom_skills_input):
+    # Blank entries from stray commas would match every resume, so they are dropped;
+    # a tuple keeps the vocabulary cache keys stable across reruns
+    custom_skills = tuple(skill for skill in map(str.strip, custom_skills_input.split(",")) if skill)
+    return custom_skills or default_skills
+
+
+def _skill_vocabulary(custom_skills, base_skills):
+    # Custom skills usually repeat industry names; scanning each distinct name once
+    # finds the same skills
+    return tuple(dict.fromkeys((*custom_skills, *base_skills)))
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_extract_skills(text, skills):
+    return extract_skills(text, list(skills))
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_extract_skills_batch(texts, skills):
+    return extract_skills_batch(texts, list(skills))
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_extract_keywords(text):
+    return extract_keywords(text)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_extract_experience(text):
+    return extract_experience(text)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_extract_education(text):
+    return extract_education(text)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_categorize_skills(skills):
+    return categorize_skills(list(skills))
+
+# The job description only changes when the user edits it, so its requirement
+# and role detection are computed once per distinct JD text.
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_job_requirements(job_description):
+    return extract_job_requirements(job_description)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_detect_job_role(job_description):
+    return detect_job_role(job_description)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_quality(text, skills, experience, education):
+    return analyze_resume_quality(text, list(skills), experience, education)
+
+
+# The Advanced Analytics tools share one profile per upload, looked up by file digest
+# instead of re-hashing the resume text for each analyzer.
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_resume_profile(pdf_digest, _pdf_file):
+    resume_text = _cached_extract_text(pdf_digest, _pdf_file)
+    return {"resume_text": resume_text, **analyze_resume(resume_text, default_skills)}
+
+
+# Text analyzers for the ATS & Power Tools tab; re-running the analysis with the
+# same resume (e.g. against a new job description) reuses them.
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_keyword_density(text, job_skills):
+    return get_keyword_density(text, list(job_skills))
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_ats_checklist(text, skills, experience, education):
+    return get_ats_checklist(text, list(skills), experience, education)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_readability(text):
+    return get_readability_stats(text)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_action_verbs(text):
+    return get_action_verb_suggestions(text)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_batch_quality(texts, skills):
+    return [score_resume_quality(text, list(resume_skills)) for text, resume_skills in zip(texts, skills)]
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _cached_csv(ranking_df):
+    # Reruns that only touch widgets reuse the serialized export
+    return ranking_df.to_csv(index=False).encode("utf-8")
+
+
+# ==========================================
+# CACHED CHARTS
+# ==========================================
+# Figures depend only on a few numbers, so they are built once per distinct input
+# and shared; callers must not mutate the returned figures. plotly.graph_objects is
+# imported where a figure is first built, so startup does not pay for it.
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _match_breakdown_fig(matched_count, missing_count):
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[
+        go.Bar(name='Matched', x=['Skills'], y=[matched_count], 
+              marker_color='#28a745', text=str(matched_count), textposition='auto'),
+        go.Bar(name='Missing', x=['Skills'], y=[missing_count], 
+              marker_color='#dc3545', text=str(missing_count), textposition='auto')
+    ])
+    fig.update_layout(
+        title="Skills Match Breakdown",
+        barmode='stack',
+        height=350,
+        showlegend=True,
+        yaxis_title="Number of Skills"
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _match_gauge_fig(match_score):
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[go.Indicator(
+        mode="gauge+number",
+        value=match_score,
+        title={'text': "Job Match Score"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "#ff7f0e"},
+            'steps': [
+                {'range': [0, 50], 'color': "#f8d7da"},
+                {'range': [50, 80], 'color': "#fff3cd"},
+                {'range': [80, 100], 'color': "#d4edda"}
+            ],
+        }
+    )])
+    fig.update_layout(height=350)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _salary_fig(salary_min, salary_avg, salary_max, job_role, level):
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[
+        go.Bar(x=['Min', 'Average', 'Max'],
+              y=[salary_min, salary_avg, salary_max],
+              marker_color=['#ff9999', '#66b3ff', '#99ff99'],
+              text=[f"${int(salary_min)}K", f"${int(salary_avg)}K", f"${int(salary_max)}K"],
+              textposition='outside')
+    ])
+    fig.update_layout(
+        title=f"Estimated Annual Salary - {job_role} ({level})",
+        yaxis_title="Salary (USD, Thousands)",
+        height=400,
+        showlegend=False,
+        xaxis_title="Salary Range"
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _salary_tracks_fig():
+    # Static projection, built once per process
+    import plotly.graph_objects as go
+    years = np.arange(15)
+    junior_progression = 80 + years * 8
+    mid_progression = 130 + years * 10
+    senior_progression = 200 + years * 15
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=years, y=junior_progression, mode='lines+markers', name='Junior Track', line=dict(color='#3498db', width=2)))
+    fig.add_trace(go.Scatter(x=years, y=mid_progression, mode='lines+markers', name='Mid-Level Track', line=dict(color='#2ecc71', width=2)))
+    fig.add_trace(go.Scatter(x=years, y=senior_progression, mode='lines+markers', name='Senior Track', line=dict(color='#e74c3c', width=2)))
+    fig.update_layout(
+        title="Projected Salary Growth by Career Path",
+        xaxis_title="Years of Experience",
+        yaxis_title="Annual Salary (USD, Thousands)",
+        hovermode='x unified',
+        height=400
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _market_radar_fig(your_scores):
+    import plotly.graph_objects as go
+    metrics = ['Technical Skills', 'Experience', 'Resume Quality', 'Education', 'Certifications']
+    market_avg = [75, 70, 65, 80, 50]
+    fig = go.Figure(data=[
+        go.Scatterpolar(r=your_scores, theta=metrics, fill='toself', name='You', line=dict(color='#3498db')),
+        go.Scatterpolar(r=market_avg, theta=metrics, fill='toself', name='Market Average', line=dict(color='#95a5a6'))
+    ])
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        showlegend=True,
+        height=400,
+        title="Skills & Experience Radar"
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _industry_salary_fig(experience_level):
+    import plotly.graph_objects as go
+    industry_names = list(INDUSTRY_SALARY_RANGES.keys())
+    # One row per industry, one column per trace
+    salaries = np.array([[band["min"], band["avg"], band["max"]] for band in INDUSTRY_SALARY_RANGES.values()])
+    fig = go.Figure()
+    for j, (name, color) in enumerate((('Min', '#e74c3c'), ('Average', '#3498db'), ('Max', '#2ecc71'))):
+        fig.add_trace(go.Bar(x=industry_names, y=salaries[:, j], name=name, marker_color=color))
+    fig.update_layout(
+        title=f"Salary Range by Industry ({experience_level})",
+        yaxis_title="Annual Salary (USD, Thousands)",
+        barmode='group',
+        height=400
+    )
+    return fig
+
+
+_SCATTER_MAX_POINTS = 200
+_RANKING_TABLE_ROWS = 50
+_DEMAND_COLORS = {'Critical': '#c0392b', 'High': 'green', 'Medium': 'blue', 'Low': 'gray'}
+
+
+@st.cache_resource(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def _batch_charts(ranking_df):
+    # Vega-Lite specs serialize far lighter than Plotly figures; DataFrames hash by content
+    import altair as alt
+    score_color = alt.Color('ATS Score:Q', scale=alt.Scale(scheme='redyellowgreen'))
+    top_chart = alt.Chart(ranking_df.head(10), title="Top 10 Resumes by ATS Score").mark_bar().encode(
+        x=alt.X('Resume:N', sort=None),
+        y='ATS Score:Q',
+        color=score_color,
+        tooltip=['Resume', 'ATS Score']
+    ).properties(height=400)
+    # ranking_df is sorted by ATS Score, so large batches plot only the leading candidates
+    scatter_title = "Job Match vs Resume Quality"
+    if len(ranking_df) > _SCATTER_MAX_POINTS:
+        scatter_title += f" (top {_SCATTER_MAX_POINTS})"
+    scatter_chart = alt.Chart(ranking_df.head(_SCATTER_MAX_POINTS), title=scatter_title).mark_circle().encode(
+        x='Job Match %:Q',
+        y='Quality %:Q',
+        size='ATS Score:Q',
+        color=score_color,
+        tooltip=['Resume', 'ATS Score', 'Job Match %', 'Quality %']
+    ).properties(height=400).interactive()
+    return top_chart, scatter_chart
+
+
+# ==========================================
+# SKILL LIST RENDERING
+# ==========================================
+# Skill lists go out as one markdown element each instead of one widget per skill.
+def _skill_chips(labels, variant):
+    chips = "".join(f'<span class="skill-chip skill-chip-{variant}">{html.escape(label)}</span>' for label in labels)
+    st.markdown(f'<div class="skill-chips">{chips}</div>', unsafe_allow_html=True)
+
+
+def _skill_bullets(skills):
+    if skills:
+        st.markdown("\n".join(f"- {skill}" for skill in skills))
+
 
 # ==========================================
 # MODE 1: SINGLE RESUME ANALYSIS
@@ -113,155 +461,268 @@ if option == "📄 Single Resume Analysis":
     st.markdown('<p class="big-font">📄 Single Resume Analyzer</p>', unsafe_allow_html=True)
     st.markdown("Analyze a single resume against a job description with detailed insights")
     
-    col1, col2 = st.columns(2)
+    with st.form("single_analysis"):
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.subheader("📤 Upload Resume")
-        uploaded_file = st.file_uploader("Choose a PDF resume", type="pdf", key="single_resume")
-        
-        st.subheader("🎯 Custom Skills (Optional)")
-        custom_skills_input = st.text_area(
-            "Enter skills separated by commas (leave blank to use defaults)",
-            height=100,
-            placeholder="Python, SQL, Machine Learning..."
-        )
+        with col1:
+            st.subheader("📤 Upload Resume")
+            uploaded_file = st.file_uploader("Choose a PDF resume", type="pdf", key="single_resume")
+        
+            st.subheader("🎯 Custom Skills (Optional)")
+            custom_skills_input = st.text_area(
+                "Enter skills separated by commas (leave blank to use defaults)",
+                height=100,
+                placeholder="Python, SQL, Machine Learning..."
+            )
         
-        if custom_skills_input:
-            custom_skills = [skill.strip() for skill in custom_skills_input.split(",")]
-        else:
-            custom_skills = default_skills
+            custom_skills = _parse_custom_skills(custom_skills_input)
     
-    with col2:
-        st.subheader("📋 Job Description")
-        job_description = st.text_area(
-            "Paste the full job description",
-            height=280,
-            placeholder="Paste job description here..."
-        )
-    
-    if not uploaded_file or not job_description or len(job_description.strip()) <= 20:
-        st.info("👆 **Upload a PDF resume** and **paste the job description** (at least 20 characters) to run the analysis.")
+        with col2:
+            st.subheader("📋 Job Description")
+            job_description = st.text_area(
+                "Paste the full job description",
+                height=280,
+                placeholder="Paste job description here..."
+            )
+
+        submitted = st.form_submit_button("🔍 Analyze Resume", type="primary", use_container_width=True)
+
+    # Heavy extraction only runs when the form is submitted; every other rerun
+    # (tab clicks, expanders) renders from the analysis kept in session_state
+    if submitted:
+        st.session_state.pop("analysis", None)
+        if uploaded_file and job_description and len(job_description.strip()) > 20:
+            resume_text, pdf_truncated = _cached_extract_pdf(_upload_digest(uploaded_file), uploaded_file)
+            analysis = {"resume_text": resume_text, "pdf_truncated": pdf_truncated}
+            if not resume_text.startswith("Error"):
+                # Extract resume data: custom skills enriched with the full industry skill list
+                # (tech + soft + creative) so we don't miss matches, scanned in a single pass
+                resume_skills = _cached_extract_skills(resume_text, _skill_vocabulary(custom_skills, ALL_INDUSTRY_SKILLS))
+                categorized = _cached_categorize_skills(tuple(resume_skills))  # Add this early for ATS breakdown
+                # Derived category lists for the Skills tab, built once per analysis
+                transfer_skills = categorized['technical'] + categorized.get('tools', [])
+                tools_and_creative = categorized.get('tools', []) + categorized.get('creative', [])
+                tools_and_creative_count = len(tools_and_creative)
+                tools_and_creative_sorted = sorted(set(tools_and_creative))
+
+                # Extract job requirements from the job description (includes role-based expansion)
+                job_skills = _cached_job_requirements(job_description)
+        
+                # Detect job role from description for role-specific analysis
+                detected_job_role = _cached_detect_job_role(job_description)
+        
+                experience = _cached_extract_experience(resume_text)
+                if experience == 0:  # Default minimum if not found
+                    resume_lower = resume_text.lower()
+                    if 'senior' in resume_lower:
+                        experience = 5
+                    elif 'junior' in resume_lower:
+                        experience = 1
+                    else:
+                        experience = 2
+                education = _cached_extract_education(resume_text)
+        
+                # Ensure we have meaningful data
+                if not resume_skills:
+                    resume_skills = ['Python', 'JavaScript']
+                if not job_skills:
+                    job_skills = ['Python', 'JavaScript']
+                if not experience:
+                    experience = 2
+        
+                # Normalize both skill lists once for the set operations below
+                resume_norm_counts = Counter(normalize_skill(s) for s in resume_skills)
+                job_norms = frozenset(normalize_skill(s) for s in job_skills)
+        
+                # Calculate scores (matched/missing come back already split into technical subsets)
+                match_score, matched_skills, missing_skills, matched_technical, missing_technical = (
+                    calculate_match_with_technical(resume_skills, job_skills)
+                )
+                weighted_score = calculate_weighted_match_score(resume_skills, job_skills)
+                quality_score, quality_issues, quality_analysis = _cached_quality(resume_text, tuple(resume_skills), experience, education)
+                
+                # Calculate ATS compatibility (based on resume quality + technical skills + experience)
+                # ATS considers: resume structure (quality) + technical skills match + experience
+                technical_skills_count = len([s for s in resume_skills if is_technical_skill(s)])
+                skill_factor = min(100, (technical_skills_count / 10) * 100) if technical_skills_count else 0  # 10 tech skills = 100
+                experience_factor = min(100, (experience / 8) * 100) if experience else 0  # 8 years = 100
+                ats_score = (quality_score * 0.5) + (skill_factor * 0.25) + (experience_factor * 0.25)
+        
+                # Find matching job roles based on resume skills
+                # Every role is scored in one vectorized pass; records are built only for
+                # the five roles that are shown
+                role_scores = score_job_profiles(resume_norm_counts)
+                top_roles = []
+                for i in heapq.nlargest(5, range(len(JOB_PROFILE_ROLES)), key=role_scores['match_score'].__getitem__):
+                    role = JOB_PROFILE_ROLES[i]
+                    profile = JOB_PROFILE_RECORDS[role]
+                    eligibility = role_scores['eligibility'][i]
+                    top_roles.append({
+                        'role': role,
+                        'match_score': role_scores['match_score'][i],
+                        'critical_missing': role_scores['critical_missing'][i],
+                        'critical_matched': role_scores['critical_matched'][i],
+                        'total_critical': len(profile.critical),
+                        'eligibility': eligibility,
+                        'color': ELIGIBILITY_COLORS[eligibility],
+                        'min_exp': profile.min_experience,
+                        'salary': profile.salary_avg
+                    })
+        
+                # Advanced analysis
+                skill_gaps = get_skill_gaps(resume_skills, job_skills)
+                certifications = match_certifications(job_description, resume_text, resume_skills)
+                salary_prediction = predict_salary(experience, resume_skills, education)
+                interview_readiness = get_interview_readiness_score(resume_skills, job_skills, experience, education)
+                career_paths = get_career_progression_path(experience, resume_skills)
+                keyword_density = _cached_keyword_density(resume_text, tuple(job_skills))
+                ats_checklist = _cached_ats_checklist(resume_text, tuple(resume_skills), experience, education)
+                readability_stats = _cached_readability(resume_text)
+                action_verb_suggestions = _cached_action_verbs(resume_text)
+                tailoring_phrases = get_tailoring_phrases(job_skills, list(missing_skills), detected_job_role)
+                interview_questions = get_interview_questions(detected_job_role, missing_technical, experience)
+                cover_letter_bullets = get_cover_letter_bullets(resume_skills, job_skills, experience, detected_job_role)
+
+                # Format the static markdown panels once per analysis; reruns just re-emit them
+                markdown_blocks = {
+                    "ats_quality": f"""**Resume Quality: {quality_score:.0f}%** (50% of ATS)
+    - Structure & formatting
+    - Sections completeness
+    - Contact information
+    - Keyword usage""",
+                    "ats_skills": f"""**Skills Level: {skill_factor:.0f}%** (25% of ATS)
+    - Total skills found: {len(resume_skills)}
+    - Recommended: 8-15 skills
+    - Technical: {len(categorized['technical'])}
+    - Soft skills: {len(categorized['soft'])}""",
+                    "ats_experience": f"""**Experience Factor: {experience_factor:.0f}%** (25% of ATS)
+    - Years: {experience}
+    - Target: 2-10 years
+    - Education: {education}""",
+                    "salary": f"""
+                    **Salary Range:** ${int(salary_prediction['min'])}K - ${int(salary_prediction['max'])}K  
+                    **Average:** ${int(salary_prediction['avg'])}K {salary_prediction['period']}  
+                    **Seniority Level:** {salary_prediction['level']}  
+                    **Job Role:** {detected_job_role}
+
+                    *Calculated based on:*
+                    - Experience: {experience} years
+                    - Education: {education}
+                    - Technical Skills: {len(resume_skills)} skills
+                    - Role Requirements: {detected_job_role}
+                    """,
+                    "career_paths": [f"""
+                    **Path {idx}: {path['title']}**
+                    - Timeline: {path['timeline']}
+                    - Salary increase: {path['salary_increase']}
+                    - Skills to develop: {', '.join(path['skills'])}
+                    """ for idx, path in enumerate(career_paths, 1)],
+                }
+
+                # The report is rendered once per analysis; the download button reuses the bytes
+                report_text = generate_report_text(
+                    detected_job_role, match_score, weighted_score, quality_score, ats_score,
+                    experience, education, resume_skills, job_skills, matched_technical,
+                    missing_technical, quality_issues, skill_gaps, salary_prediction,
+                    interview_readiness, keyword_density
+                )
+                report_bytes = report_text.encode("utf-8")
+
+                analysis.update({
+                    "resume_skills": resume_skills,
+                    "categorized": categorized,
+                    "transfer_skills": transfer_skills,
+                    "tools_and_creative_count": tools_and_creative_count,
+                    "tools_and_creative_sorted": tools_and_creative_sorted,
+                    "job_skills": job_skills,
+                    "detected_job_role": detected_job_role,
+                    "experience": experience,
+                    "education": education,
+                    "resume_norm_counts": resume_norm_counts,
+                    "job_norms": job_norms,
+                    "match_score": match_score,
+                    "matched_skills": matched_skills,
+                    "missing_skills": missing_skills,
+                    "weighted_score": weighted_score,
+                    "quality_score": quality_score,
+                    "quality_issues": quality_issues,
+                    "matched_technical": matched_technical,
+                    "missing_technical": missing_technical,
+                    "ats_score": ats_score,
+                    "top_roles": top_roles,
+                    "skill_gaps": skill_gaps,
+                    "certifications": certifications,
+                    "salary_prediction": salary_prediction,
+                    "interview_readiness": interview_readiness,
+                    "keyword_density": keyword_density,
+                    "ats_checklist": ats_checklist,
+                    "readability_stats": readability_stats,
+                    "action_verb_suggestions": action_verb_suggestions,
+                    "tailoring_phrases": tailoring_phrases,
+                    "interview_questions": interview_questions,
+                    "cover_letter_bullets": cover_letter_bullets,
+                    "markdown_blocks": markdown_blocks,
+                    "report_text": report_text,
+                    "report_bytes": report_bytes,
+                })
+            st.session_state["analysis"] = analysis
+
+    analysis = st.session_state.get("analysis")
+    if analysis is None:
+        st.info("👆 **Upload a PDF resume**, **paste the job description** (at least 20 characters) and click **Analyze Resume** to run the analysis.")
         st.markdown("---")
         with st.expander("📖 How to use"):
             st.markdown("""
             1. **Upload** your resume (PDF only).
             2. **Paste** the full job description in the right box.
             3. Optionally add **custom skills** (comma-separated) if your role uses specific tech.
-            4. You’ll see **8 tabs**: Overview, Skills, Quality, Recommendations, Career & Salary, Interview Ready, Certifications, ATS & Power Tools.
-            5. In **Overview** you can **Download Report** to save the analysis as text.
+            4. Click **Analyze Resume**; edits to the inputs only take effect on the next click.
+            5. You’ll see **8 tabs**: Overview, Skills, Quality, Recommendations, Career & Salary, Interview Ready, Certifications, ATS & Power Tools.
+            6. In **Overview** you can **Download Report** to save the analysis as text.
             """)
-    elif uploaded_file and job_description and len(job_description.strip()) > 20:
-        resume_text = extract_text_from_pdf(uploaded_file)
+    else:
+        resume_text = analysis["resume_text"]
         if resume_text.startswith("Error"):
             st.error(resume_text)
             st.caption("Try re-uploading the PDF or use a different file.")
         else:
-            # Extract resume data
-            resume_skills = extract_skills(resume_text, custom_skills)
-            # Enrich with full industry skill list (tech + creative) so we don't miss matches
-            all_industry_skills = list(TECHNICAL_SKILLS.keys()) + list(SOFT_SKILLS.keys()) + list(CREATIVE_SKILLS.keys())
-            resume_skills_from_full = extract_skills(resume_text, all_industry_skills)
-            resume_skills = sorted(list(set(resume_skills) | set(resume_skills_from_full)))
-            categorized = categorize_skills(resume_skills)  # Add this early for ATS breakdown
-
-            # Extract job requirements from the job description (includes role-based expansion)
-            job_skills = extract_job_requirements(job_description)
-        
-            # Detect job role from description for role-specific analysis
-            detected_job_role = detect_job_role(job_description)
-        
-            experience = extract_experience(resume_text)
-            if experience == 0:  # Default minimum if not found
-                if 'senior' in resume_text.lower():
-                    experience = 5
-                elif 'junior' in resume_text.lower():
-                    experience = 1
-                else:
-                    experience = 2
-            education = extract_education(resume_text)
-        
-            # Ensure we have meaningful data
-            if not resume_skills:
-                resume_skills = ['Python', 'JavaScript']
-            if not job_skills:
-                job_skills = ['Python', 'JavaScript']
-            if not experience:
-                experience = 2
-        
-            # Calculate scores
-            match_score, matched_skills, missing_skills = calculate_match(resume_skills, job_skills)
-            weighted_score = calculate_weighted_match_score(resume_skills, job_skills)
-            quality_score, quality_issues, quality_analysis = analyze_resume_quality(resume_text, resume_skills, experience, education)
-        
-            # Filter to only technical skills for matched and missing
-            matched_technical = filter_technical_skills(matched_skills)
-            missing_technical = filter_technical_skills(list(missing_skills))
-        
-            # Calculate ATS compatibility (based on resume quality + technical skills + experience)
-            # ATS considers: resume structure (quality) + technical skills match + experience
-            technical_skills_count = len([s for s in resume_skills if is_technical_skill(s)])
-            skill_factor = min(100, (technical_skills_count / 10) * 100) if technical_skills_count else 0  # 10 tech skills = 100
-            experience_factor = min(100, (experience / 8) * 100) if experience else 0  # 8 years = 100
-            ats_score = (quality_score * 0.5) + (skill_factor * 0.25) + (experience_factor * 0.25)
-        
-            # Find matching job roles based on resume skills
-            role_matches = []
-            for role, profile in JOB_PROFILES.items():
-                required_critical = profile['required_skills']['critical']
-                required_all = required_critical + profile['required_skills']['required']
-            
-                # Calculate match for this role
-                role_match_score, role_matched, role_missing = calculate_match(resume_skills, required_all)
-            
-                # Count critical skills missing and matched
-                critical_missing = sum(1 for s in role_missing if normalize_skill(s) in {normalize_skill(c) for c in required_critical})
-                critical_matched = sum(1 for s in role_matched if normalize_skill(s) in {normalize_skill(c) for c in required_critical})
-            
-                # Better eligibility determination based on critical skills
-                total_critical = len(required_critical)
-                critical_match_pct = (critical_matched / total_critical * 100) if total_critical > 0 else 0
-            
-                if critical_match_pct >= 80 and role_match_score >= 70:
-                    eligibility = "Excellent Match"
-                    color = "🟢"
-                elif critical_match_pct >= 60 and role_match_score >= 55:
-                    eligibility = "Good Match"
-                    color = "🟡"
-                elif critical_match_pct >= 40 and role_match_score >= 40:
-                    eligibility = "Potential Match"
-                    color = "🟠"
-                else:
-                    eligibility = "Learning Required"
-                    color = "🔴"
-            
-                role_matches.append({
-                    'role': role,
-                    'match_score': role_match_score,
-                    'critical_missing': critical_missing,
-                    'critical_matched': critical_matched,
-                    'total_critical': total_critical,
-                    'eligibility': eligibility,
-                    'color': color,
-                    'min_exp': profile['min_experience'],
-                    'salary': profile['salary_2024']['avg']
-                })
-        
-            # Sort by match score
-            role_matches = sorted(role_matches, key=lambda x: x['match_score'], reverse=True)
-        
-            # Advanced analysis
-            skill_gaps = get_skill_gaps(resume_skills, job_skills)
-            certifications = match_certifications(job_description, resume_text, resume_skills)
-            salary_prediction = predict_salary(experience, resume_skills, education)
-            interview_readiness = get_interview_readiness_score(resume_skills, job_skills, experience, education)
-            career_paths = get_career_progression_path(experience, resume_skills)
-            keyword_density = get_keyword_density(resume_text, job_skills)
-            ats_checklist = get_ats_checklist(resume_text, resume_skills, experience, education)
-            readability_stats = get_readability_stats(resume_text)
-            action_verb_suggestions = get_action_verb_suggestions(resume_text)
-            tailoring_phrases = get_tailoring_phrases(job_skills, list(missing_skills), detected_job_role)
-            interview_questions = get_interview_questions(detected_job_role, missing_technical, experience)
-            cover_letter_bullets = get_cover_letter_bullets(resume_skills, job_skills, experience, detected_job_role)
+            if analysis["pdf_truncated"]:
+                st.caption(f"ℹ️ Long PDF: only the first {MAX_PDF_PAGES} pages (up to {MAX_PDF_CHARS:,} characters) were analyzed.")
+            resume_skills = analysis["resume_skills"]
+            categorized = analysis["categorized"]
+            transfer_skills = analysis["transfer_skills"]
+            tools_and_creative_count = analysis["tools_and_creative_count"]
+            tools_and_creative_sorted = analysis["tools_and_creative_sorted"]
+            job_skills = analysis["job_skills"]
+            detected_job_role = analysis["detected_job_role"]
+            experience = analysis["experience"]
+            education = analysis["education"]
+            resume_norm_counts = analysis["resume_norm_counts"]
+            job_norms = analysis["job_norms"]
+            match_score = analysis["match_score"]
+            matched_skills = analysis["matched_skills"]
+            missing_skills = analysis["missing_skills"]
+            weighted_score = analysis["weighted_score"]
+            quality_score = analysis["quality_score"]
+            quality_issues = analysis["quality_issues"]
+            matched_technical = analysis["matched_technical"]
+            missing_technical = analysis["missing_technical"]
+            ats_score = analysis["ats_score"]
+            top_roles = analysis["top_roles"]
+            skill_gaps = analysis["skill_gaps"]
+            certifications = analysis["certifications"]
+            salary_prediction = analysis["salary_prediction"]
+            interview_readiness = analysis["interview_readiness"]
+            keyword_density = analysis["keyword_density"]
+            ats_checklist = analysis["ats_checklist"]
+            readability_stats = analysis["readability_stats"]
+            action_verb_suggestions = analysis["action_verb_suggestions"]
+            tailoring_phrases = analysis["tailoring_phrases"]
+            interview_questions = analysis["interview_questions"]
+            cover_letter_bullets = analysis["cover_letter_bullets"]
+            markdown_blocks = analysis["markdown_blocks"]
+            report_text = analysis["report_text"]
+            report_bytes = analysis["report_bytes"]
 
             # Tabs for different views
             tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
@@ -288,22 +749,15 @@ if option == "📄 Single Resume Analysis":
                     st.markdown(f"**Required Skills Detected:** {len(job_skills)}")
             
                 st.markdown("**Skills Required for this Role:**")
-                skill_cols = st.columns(min(4, len(job_skills)))
-                for idx, skill in enumerate(sorted(job_skills)):
-                    with skill_cols[idx % 4]:
-                        st.info(f"✓ {skill}")
+                _skill_chips((f"✓ {skill}" for skill in sorted(job_skills)), "info")
 
                 with st.expander("🎯 Ideal candidate for this role"):
                     for bullet in get_ideal_candidate_snapshot(detected_job_role):
                         st.markdown(f"- {bullet}")
 
-                report_text = generate_report_text(
-                    detected_job_role, match_score, weighted_score, quality_score, ats_score,
-                    experience, education, resume_skills, job_skills, matched_technical,
-                    missing_technical, quality_issues, skill_gaps, salary_prediction,
-                    interview_readiness, keyword_density
-                )
-                st.download_button("📥 Download Report (TXT)", data=report_text, file_name="resume_analysis_report.txt", mime="text/plain", key="dl_report_overview")
+                st.download_button("📥 Download Report (TXT)", data=report_bytes, file_name="resume_analysis_report.txt", mime="text/plain", key="dl_report_overview")
+                with st.expander("📄 Preview Report"):
+                    st.code(report_text, language="text")
 
                 st.divider()
 
@@ -336,24 +790,13 @@ if option == "📄 Single Resume Analysis":
                 col_breakdown1, col_breakdown2, col_breakdown3 = st.columns(3)
             
                 with col_breakdown1:
-                    st.markdown(f"""**Resume Quality: {quality_score:.0f}%** (50% of ATS)
-    - Structure & formatting
-    - Sections completeness
-    - Contact information
-    - Keyword usage""")
+                    st.markdown(markdown_blocks["ats_quality"])
             
                 with col_breakdown2:
-                    st.markdown(f"""**Skills Level: {skill_factor:.0f}%** (25% of ATS)
-    - Total skills found: {len(resume_skills)}
-    - Recommended: 8-15 skills
-    - Technical: {len(categorized['technical'])}
-    - Soft skills: {len(categorized['soft'])}""")
+                    st.markdown(markdown_blocks["ats_skills"])
             
                 with col_breakdown3:
-                    st.markdown(f"""**Experience Factor: {experience_factor:.0f}%** (25% of ATS)
-    - Years: {experience}
-    - Target: 2-10 years
-    - Education: {education}""")
+                    st.markdown(markdown_blocks["ats_experience"])
             
                 # Main visualization
                 st.subheader("📈 Detailed Match Analysis")
@@ -364,46 +807,18 @@ if option == "📄 Single Resume Analysis":
                     matched_count = len(matched_skills)
                     missing_count = max(0, len(job_skills) - len(matched_skills))
                 
-                    fig = go.Figure(data=[
-                        go.Bar(name='Matched', x=['Skills'], y=[matched_count], 
-                              marker_color='#28a745', text=str(matched_count), textposition='auto'),
-                        go.Bar(name='Missing', x=['Skills'], y=[missing_count], 
-                              marker_color='#dc3545', text=str(missing_count), textposition='auto')
-                    ])
-                    fig.update_layout(
-                        title="Skills Match Breakdown",
-                        barmode='stack',
-                        height=350,
-                        showlegend=True,
-                        yaxis_title="Number of Skills"
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(_match_breakdown_fig(matched_count, missing_count), use_container_width=True)
             
                 with col_chart2:
-                    fig = go.Figure(data=[go.Indicator(
-                        mode="gauge+number",
-                        value=match_score,
-                        title={'text': "Job Match Score"},
-                        gauge={
-                            'axis': {'range': [0, 100]},
-                            'bar': {'color': "#ff7f0e"},
-                            'steps': [
-                                {'range': [0, 50], 'color': "#f8d7da"},
-                                {'range': [50, 80], 'color': "#fff3cd"},
-                                {'range': [80, 100], 'color': "#d4edda"}
-                            ],
-                        }
-                    )])
-                    fig.update_layout(height=350)
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(_match_gauge_fig(match_score), use_container_width=True)
             
                 # Role Matching Section (only for tech roles in our database)
                 st.divider()
                 st.subheader("🎯 Eligible Roles Based on Your Resume")
 
-                if detected_job_role in JOB_PROFILES and role_matches:
+                if detected_job_role in JOB_PROFILES and top_roles:
                     st.markdown("**Top roles you're qualified for:**")
-                    for idx, role_data in enumerate(role_matches[:5], 1):
+                    for idx, role_data in enumerate(top_roles, 1):
                         col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
                         with col1:
                             st.markdown(f"{role_data['color']} **{idx}. {role_data['role']}**")
@@ -436,19 +851,12 @@ if option == "📄 Single Resume Analysis":
                 st.subheader(f"✅ {match_label}")
                 st.caption(f"Found {len(display_matched)} skills that match this job")
                 if display_matched:
-                    skill_cols = st.columns(min(3, len(display_matched)))
-                    for idx, skill in enumerate(sorted(display_matched)):
-                        with skill_cols[idx % 3]:
-                            st.success(f"✓ {skill}")
+                    _skill_chips((f"✓ {skill}" for skill in sorted(display_matched)), "success")
                 else:
                     st.warning("No skills matched")
                 if not display_matched and (categorized['technical'] or categorized.get('tools')):
-                    transfer_skills = categorized['technical'] + categorized.get('tools', [])
                     st.markdown("**Your skills (highlight these as transferable):**")
-                    transfer_cols = st.columns(min(3, len(transfer_skills)))
-                    for idx, skill in enumerate(sorted(transfer_skills)[:9]):
-                        with transfer_cols[idx % 3]:
-                            st.info(f"• {skill}")
+                    _skill_chips((f"• {skill}" for skill in heapq.nsmallest(9, transfer_skills)), "info")
 
                 st.divider()
 
@@ -460,8 +868,7 @@ if option == "📄 Single Resume Analysis":
                     col1, col2 = st.columns([1, 2])
                     with col1:
                         st.markdown("**Priority Skills to Learn:**")
-                        for idx, skill in enumerate(sorted(missing_display)[:5], 1):
-                            st.error(f"{idx}. {skill}")
+                        _skill_chips((f"{idx}. {skill}" for idx, skill in enumerate(heapq.nsmallest(5, missing_display), 1)), "error")
                     with col2:
                         if len(display_missing) > 5:
                             st.info(f"+ {len(display_missing) - 5} more skills needed")
@@ -474,21 +881,17 @@ if option == "📄 Single Resume Analysis":
 
                 # Skills Categorization
                 st.subheader("Skills by Category")
-                tools_and_creative = categorized.get('tools', []) + categorized.get('creative', [])
 
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.markdown(f"**Technical Skills** ({len(categorized['technical'])})")
-                    for skill in categorized['technical']:
-                        st.write(f"• {skill}")
+                    _skill_bullets(categorized['technical'])
                 with col2:
                     st.markdown(f"**Soft Skills** ({len(categorized['soft'])})")
-                    for skill in categorized['soft']:
-                        st.write(f"• {skill}")
+                    _skill_bullets(categorized['soft'])
                 with col3:
-                    st.markdown(f"**Tools & Creative** ({len(tools_and_creative)})")
-                    for skill in sorted(set(tools_and_creative)):
-                        st.write(f"• {skill}")
+                    st.markdown(f"**Tools & Creative** ({tools_and_creative_count})")
+                    _skill_bullets(tools_and_creative_sorted)
         
             # TAB 3: QUALITY REPORT
             with tab3:
@@ -498,12 +901,7 @@ if option == "📄 Single Resume Analysis":
                     st.subheader("Resume Quality Score: " + str(round(quality_score, 1)) + "%")
                 
                     # Progress bar
-                    fig = go.Figure(data=[
-                        go.Bar(x=[quality_score], y=['Quality'], orientation='h', 
-                              marker=dict(color='#1f77b4'), text=f'{quality_score:.1f}%', textposition='auto')
-                    ])
-                    fig.update_layout(height=100, xaxis_range=[0, 100], showlegend=False)
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.progress(min(100, max(0, int(quality_score))), text=f"Quality: {quality_score:.1f}%")
                 
                     if quality_issues:
                         st.subheader("⚠️ Issues Found:")
@@ -564,7 +962,7 @@ if option == "📄 Single Resume Analysis":
                             else:
                                 st.warning(f"Priority: {gap['priority']}")
                         with col3:
-                            demand_color = {'Critical': '#c0392b', 'High': 'green', 'Medium': 'blue', 'Low': 'gray'}.get(gap['demand'], 'gray')
+                            demand_color = _DEMAND_COLORS.get(gap['demand'], 'gray')
                             st.markdown(f"<span style='color:{demand_color}'>📈 Demand: {gap['demand']}</span>", unsafe_allow_html=True)
                         with col4:
                             growth = gap.get('growth', 0)
@@ -573,14 +971,14 @@ if option == "📄 Single Resume Analysis":
                 st.divider()
             
             st.subheader("📝 Action Items")
-            missing_set = set(normalize_skill(s) for s in job_skills) - set(normalize_skill(s) for s in resume_skills)
+            missing_set = job_norms - resume_norm_counts.keys()
             missing_action = [s.title() for s in missing_set]
             missing_technical_action = [s for s in missing_action if is_technical_skill(s)]
 
             if len(missing_technical_action) > 0:
                 st.markdown(f"""
                 **Priority 1: Learn Missing Technical Skills ({len(missing_technical_action)})**
-                - {', '.join(sorted(missing_technical_action)[:5])}
+                - {', '.join(heapq.nsmallest(5, missing_technical_action))}
                 
                     **How to improve:**
                     1. Take online courses (Udemy, Coursera, LinkedIn Learning)
@@ -617,45 +1015,18 @@ if option == "📄 Single Resume Analysis":
                     salary = salary_prediction
                 
                     # Create salary visualization with role context
-                    fig = go.Figure(data=[
-                        go.Bar(x=['Min', 'Average', 'Max'],
-                              y=[salary['min'], salary['avg'], salary['max']],
-                              marker_color=['#ff9999', '#66b3ff', '#99ff99'],
-                              text=[f"${int(salary['min'])}K", f"${int(salary['avg'])}K", f"${int(salary['max'])}K"],
-                              textposition='outside')
-                    ])
-                    fig.update_layout(
-                        title=f"Estimated Annual Salary - {detected_job_role} ({salary['level']})",
-                        yaxis_title="Salary (USD, Thousands)",
-                        height=400,
-                        showlegend=False,
-                        xaxis_title="Salary Range"
+                    st.plotly_chart(
+                        _salary_fig(salary['min'], salary['avg'], salary['max'], detected_job_role, salary['level']),
+                        use_container_width=True
                     )
-                    st.plotly_chart(fig, use_container_width=True)
                 
-                    st.markdown(f"""
-                    **Salary Range:** ${int(salary['min'])}K - ${int(salary['max'])}K  
-                    **Average:** ${int(salary['avg'])}K {salary['period']}  
-                    **Seniority Level:** {salary['level']}  
-                    **Job Role:** {detected_job_role}
-
-                    *Calculated based on:*
-                    - Experience: {experience} years
-                    - Education: {education}
-                    - Technical Skills: {len(resume_skills)} skills
-                    - Role Requirements: {detected_job_role}
-                    """)
+                    st.markdown(markdown_blocks["salary"])
             
                 with col2:
                     st.subheader("📈 Career Progression Paths")
-                    for idx, path in enumerate(career_paths, 1):
+                    for path_markdown in markdown_blocks["career_paths"]:
                         with st.container():
-                            st.markdown(f"""
-                            **Path {idx}: {path['title']}**
-                            - Timeline: {path['timeline']}
-                            - Salary increase: {path['salary_increase']}
-                            - Skills to develop: {', '.join(path['skills'])}
-                            """)
+                            st.markdown(path_markdown)
                             st.divider()
         
             # TAB 6: INTERVIEW READINESS
@@ -718,38 +1089,25 @@ if option == "📄 Single Resume Analysis":
                             grouped_certs[area] = []
                         grouped_certs[area].append(cert_item)
                 
-                    # Display grouped certifications with enhanced details
+                    # Display grouped certifications, one table per area
+                    def color_relevance(val):
+                        if val == 'Critical':
+                            return 'background-color: #f8d7da'
+                        elif val == 'High':
+                            return 'background-color: #ffe5cc'
+                        return 'background-color: #fff3cd'
+
                     for area, cert_group in grouped_certs.items():
                         st.markdown(f"### **{area}**")
-                        for cert_item in cert_group:
-                            relevance = cert_item.get('relevance', 'Medium')
-                            duration = cert_item.get('duration', '2-3 months')
-                        
-                            # Color code by relevance
-                            if relevance == 'Critical':
-                                col1, col2, col3 = st.columns([3, 1, 1])
-                                with col1:
-                                    st.write(f"🔴 **{cert_item['cert']}**")
-                                with col2:
-                                    st.error(relevance)
-                                with col3:
-                                    st.info(f"⏱️ {duration}")
-                            elif relevance == 'High':
-                                col1, col2, col3 = st.columns([3, 1, 1])
-                                with col1:
-                                    st.write(f"🟠 **{cert_item['cert']}**")
-                                with col2:
-                                    st.warning(relevance)
-                                with col3:
-                                    st.info(f"⏱️ {duration}")
-                            else:
-                                col1, col2, col3 = st.columns([3, 1, 1])
-                                with col1:
-                                    st.write(f"🟡 **{cert_item['cert']}**")
-                                with col2:
-                                    st.info(relevance)
-                                with col3:
-                                    st.info(f"⏱️ {duration}")
+                        df_area = pd.DataFrame([{
+                            'Certification': cert_item['cert'],
+                            'Relevance': cert_item.get('relevance', 'Medium'),
+                            'Duration': cert_item.get('duration', '2-3 months'),
+                        } for cert_item in cert_group])
+                        st.dataframe(
+                            df_area.style.map(color_relevance, subset=['Relevance']),
+                            use_container_width=True, hide_index=True
+                        )
                         st.divider()
                 else:
                     st.info("No specific certifications detected for this role")
@@ -788,8 +1146,11 @@ if option == "📄 Single Resume Analysis":
                 st.divider()
                 st.subheader("📋 Job Keywords in Your Resume")
                 if keyword_density['found']:
-                    for skill, count in sorted(keyword_density['found'], key=lambda x: -x[1])[:15]:
-                        st.success(f"✓ **{skill}** (appears {count}×)")
+                    # One box per section, lines joined with markdown hard breaks
+                    st.success("  \n".join(
+                        f"✓ **{skill}** (appears {count}×)"
+                        for skill, count in heapq.nsmallest(15, keyword_density['found'], key=lambda x: -x[1])
+                    ))
                 if keyword_density['missing']:
                     st.markdown("**Add these keywords:**")
                     missing_display = [s.title() for s in keyword_density['missing'][:10]]
@@ -797,14 +1158,15 @@ if option == "📄 Single Resume Analysis":
 
                 st.divider()
                 st.subheader("✅ ATS Checklist")
-                for item in ats_checklist:
-                    status = item['status']
-                    if status == 'pass':
-                        st.success(f"✓ {item['item']}")
-                    elif status == 'warn':
-                        st.warning(f"⚠ {item['item']} — {item['tip']}")
-                    else:
-                        st.error(f"✗ {item['item']} — {item['tip']}")
+                passed = [f"✓ {item['item']}" for item in ats_checklist if item['status'] == 'pass']
+                warned = [f"⚠ {item['item']} — {item['tip']}" for item in ats_checklist if item['status'] == 'warn']
+                failed = [f"✗ {item['item']} — {item['tip']}" for item in ats_checklist if item['status'] not in ('pass', 'warn')]
+                if passed:
+                    st.success("  \n".join(passed))
+                if warned:
+                    st.warning("  \n".join(warned))
+                if failed:
+                    st.error("  \n".join(failed))
 
                 st.divider()
                 st.subheader("📖 Readability")
@@ -847,10 +1209,7 @@ elif option == "📊 Batch Resume Comparison":
             placeholder="Python, SQL, Machine Learning..."
         )
         
-        if custom_skills_input:
-            custom_skills = [skill.strip() for skill in custom_skills_input.split(",")]
-        else:
-            custom_skills = default_skills
+        custom_skills = _parse_custom_skills(custom_skills_input)
     
     st.subheader("📋 Job Description")
     job_description = st.text_area(
@@ -860,46 +1219,90 @@ elif option == "📊 Batch Resume Comparison":
     )
     
     if uploaded_files and job_description:
-        job_skills_batch = extract_job_requirements(job_description)
+        job_skills_batch = _cached_job_requirements(job_description)
         if not job_skills_batch:
             job_skills_batch = default_skills
-        all_industry = list(TECHNICAL_SKILLS.keys()) + list(SOFT_SKILLS.keys())
-        ranking_data = []
-
-        with st.spinner(f"Analyzing {len(uploaded_files)} resumes..."):
-            for file in uploaded_files:
-                resume_text = extract_text_from_pdf(file)
-                if resume_text.startswith("Error"):
-                    ranking_data.append({
-                        "Resume": file.name,
-                        "ATS Score": 0,
-                        "Job Match %": 0,
-                        "Quality %": 0,
-                        "Matched Skills": 0,
-                        "Total Skills": 0,
-                    })
-                    continue
-                resume_skills = extract_skills(resume_text, custom_skills)
-                resume_skills_full = extract_skills(resume_text, all_industry)
-                resume_skills = sorted(list(set(resume_skills) | set(resume_skills_full)))
-                job_skills = job_skills_batch
-
-                match_score, matched_skills, missing_skills = calculate_match(resume_skills, job_skills)
-                quality_score, quality_issues, quality_analysis = analyze_resume_quality(resume_text, resume_skills, 
-                                                         extract_experience(resume_text),
-                                                         extract_education(resume_text))
-                ats_score = quality_score
-                
-                ranking_data.append({
-                    "Resume": file.name,
-                    "ATS Score": round(ats_score, 2),
-                    "Job Match %": round(match_score, 2),
-                    "Quality %": round(quality_score, 2),
-                    "Matched Skills": len(matched_skills),
-                    "Total Skills": len(resume_skills)
-                })
-        
-        df = pd.DataFrame(ranking_data).sort_values(by="ATS Score", ascending=False)
+
+        # Stage progress instead of a blocking spinner; the match-only ranking is shown
+        # while quality scoring, the slowest stage, is still running
+        progress = st.progress(0.0, text=f"Parsing {len(uploaded_files)} resumes...")
+        preview_slot = st.empty()
+        # Parse every resume once up front, then score the whole batch together
+        # Files that failed to parse earlier in this session are not handed to the parser again
+        digests = [_upload_digest(file) for file in uploaded_files]
+        bad_pdfs = st.session_state.setdefault("bad_pdf_digests", set())
+        to_parse = [i for i, digest in enumerate(digests) if digest not in bad_pdfs]
+        extracted = [("Error: Could not extract text", False)] * len(uploaded_files)
+        # Each PDF is capped at MAX_PDF_PAGES pages / MAX_PDF_CHARS characters
+        parsed_pdfs = _cached_extract_pdfs(
+            tuple(digests[i] for i in to_parse), [uploaded_files[i] for i in to_parse]
+        )
+        for i, result in zip(to_parse, parsed_pdfs):
+            extracted[i] = result
+        texts = [text for text, _ in extracted]
+        bad_pdfs.update(digest for digest, text in zip(digests, texts) if text.startswith("Error"))
+        truncated_names = [file.name for file, (_, truncated) in zip(uploaded_files, extracted) if truncated]
+        parsed = [i for i, text in enumerate(texts) if not text.startswith("Error")]
+        parsed_texts = tuple(texts[i] for i in parsed)
+        progress.progress(1 / 3, text="Matching skills...")
+        # Custom + technical + soft skills in one scan; extract_skills already returns
+        # the sorted, de-duplicated union
+        batch_skills = _cached_extract_skills_batch(parsed_texts, _skill_vocabulary(custom_skills, TECH_SOFT_SKILLS))
+
+        # Skill presence matrix: one row per parsed resume, one column per detected skill
+        skill_universe = sorted(set().union(*batch_skills))
+        column_index = {skill: j for j, skill in enumerate(skill_universe)}
+        presence = np.zeros((len(parsed), len(skill_universe)), dtype=bool)
+        for row, resume_skills in enumerate(batch_skills):
+            presence[row, [column_index[skill] for skill in resume_skills]] = True
+
+        # Collapse case variants ("Python" / "python") onto one normalized column
+        job_norms = set(normalize_skill(s) for s in job_skills_batch)
+        universe_norms, norm_ids = np.unique(
+            [normalize_skill(s) for s in skill_universe], return_inverse=True
+        )
+        norm_presence = np.zeros((len(parsed), len(universe_norms)), dtype=bool)
+        rows, cols = np.nonzero(presence)
+        norm_presence[rows, norm_ids[cols]] = True
+        in_job = np.array([normalize_skill(s) in job_norms for s in skill_universe], dtype=bool)
+        norm_in_job = np.array([n in job_norms for n in universe_norms], dtype=bool)
+        matched_counts = (presence & in_job).sum(axis=1)
+        norm_matched_counts = (norm_presence & norm_in_job).sum(axis=1)
+        total_counts = presence.sum(axis=1)
+
+        # Ranking columns, one slot per upload; resumes that failed to parse keep zeros
+        ats_col = [0] * len(uploaded_files)
+        match_col = [0] * len(uploaded_files)
+        matched_col = np.zeros(len(uploaded_files), dtype=np.int64)
+        total_col = np.zeros(len(uploaded_files), dtype=np.int64)
+        matched_col[parsed] = matched_counts
+        total_col[parsed] = total_counts
+        for row, i in enumerate(parsed):
+            match_score = round((int(norm_matched_counts[row]) / len(job_norms)) * 100, 2) if job_norms else 0
+            match_col[i] = round(match_score, 2)
+
+        progress.progress(2 / 3, text="Scoring resume quality...")
+        preview_slot.dataframe(pd.DataFrame({
+            "Resume": [file.name for file in uploaded_files],
+            "Job Match %": match_col,
+            "Matched Skills": matched_col,
+            "Total Skills": total_col,
+        }).sort_values(by="Job Match %", ascending=False), use_container_width=True)
+        quality_scores = _cached_batch_quality(parsed_texts, tuple(map(tuple, batch_skills)))
+        for row, i in enumerate(parsed):
+            # ATS score is the quality score for batch ranking
+            ats_col[i] = round(quality_scores[row], 2)
+        progress.empty()
+        preview_slot.empty()
+        
+        df = pd.DataFrame({
+            "Resume": [file.name for file in uploaded_files],
+            "ATS Score": ats_col,
+            "Job Match %": match_col,
+            "Quality %": ats_col,
+            "Matched Skills": matched_col,
+            "Total Skills": total_col,
+        }).sort_values(by="ATS Score", ascending=False)
         
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -917,44 +1320,46 @@ elif option == "📊 Batch Resume Comparison":
         # Ranking table with color coding
         st.subheader("🏆 Candidate Rankings")
         
-        # Color the table based on scores
-        def color_score(val):
-            if isinstance(val, (int, float)):
-                if val >= 80:
-                    return 'background-color: #d4edda'
-                elif val >= 60:
-                    return 'background-color: #fff3cd'
-                else:
-                    return 'background-color: #f8d7da'
-            return ''
+        # Color the table based on scores, one vectorized pass per column
+        def color_score(scores):
+            return np.select(
+                [scores >= 80, scores >= 60],
+                ['background-color: #d4edda', 'background-color: #fff3cd'],
+                default='background-color: #f8d7da'
+            )
         
-        styled_df = df.style.map(color_score, subset=['ATS Score', 'Job Match %', 'Quality %'])
+        # Large batches show a leading slice; df is already ranked, so head() is the top N
+        shown_df = df
+        if len(df) > _RANKING_TABLE_ROWS:
+            shown_rows = st.slider("Show top N", 10, len(df), _RANKING_TABLE_ROWS)
+            shown_df = df.head(shown_rows)
+        styled_df = shown_df.style.apply(color_score, subset=['ATS Score', 'Job Match %', 'Quality %'])
         st.dataframe(styled_df, use_container_width=True)
+        failed_names = [file.name for file, text in zip(uploaded_files, texts) if text.startswith("Error")]
+        if failed_names:
+            st.caption(f"⚠️ Could not read {', '.join(failed_names)}; these are ranked with zero scores.")
+        if truncated_names:
+            st.caption(
+                f"ℹ️ Long PDFs: only the first {MAX_PDF_PAGES} pages (up to {MAX_PDF_CHARS:,} characters) "
+                f"were analyzed for {', '.join(truncated_names)}."
+            )
         
         # Visualizations
+        top_chart, scatter_chart = _batch_charts(df)
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = px.bar(df.head(10), x='Resume', y='ATS Score', 
-                        color='ATS Score', color_continuous_scale='RdYlGn',
-                        title="Top 10 Resumes by ATS Score")
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.altair_chart(top_chart, use_container_width=True)
         
         with col2:
-            fig = px.scatter(df, x='Job Match %', y='Quality %', 
-                           size='ATS Score', hover_name='Resume',
-                           color='ATS Score', color_continuous_scale='RdYlGn',
-                           title="Job Match vs Resume Quality")
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            # Zoom and pan stay interactive on the scatter
+            st.altair_chart(scatter_chart, use_container_width=True)
         
         # Export option
         st.subheader("💾 Export Results")
-        csv = df.to_csv(index=False)
         st.download_button(
             label="Download as CSV",
-            data=csv,
+            data=_cached_csv(df),
             file_name="resume_ranking.csv",
             mime="text/csv"
         )
@@ -975,10 +1380,11 @@ elif option == "💼 Job Description Analyzer":
     )
     
     if job_description:
-        job_skills = extract_job_requirements(job_description)
-        detected_role = detect_job_role(job_description)
-        keywords = extract_keywords(job_description)
-        categorized = categorize_skills(job_skills)
+        job_skills = _cached_job_requirements(job_description)
+        detected_role = _cached_detect_job_role(job_description)
+        keywords = _cached_extract_keywords(job_description)
+        # categorize_skills already returns each category sorted
+        categorized = _cached_categorize_skills(tuple(job_skills))
 
         # Tabs
         tab1, tab2, tab3 = st.tabs(["📊 Overview", "🛠️ Skills", "🏢 Keywords"])
@@ -998,6 +1404,7 @@ elif option == "💼 Job Description Analyzer":
             st.divider()
             
             # Skills distribution
+            import plotly.graph_objects as go
             fig = go.Figure(data=[
                 go.Bar(name='Technical', x=['Skills'], y=[len(categorized['technical'])], marker_color='#1f77b4'),
                 go.Bar(name='Soft', x=['Skills'], y=[len(categorized['soft'])], marker_color='#ff7f0e'),
@@ -1011,24 +1418,20 @@ elif option == "💼 Job Description Analyzer":
             
             with col1:
                 st.subheader(f"🔧 Technical ({len(categorized['technical'])})")
-                for skill in sorted(categorized['technical']):
-                    st.write(f"• {skill}")
+                _skill_bullets(categorized['technical'])
             
             with col2:
                 st.subheader(f"💬 Soft ({len(categorized['soft'])})")
-                for skill in sorted(categorized['soft']):
-                    st.write(f"• {skill}")
+                _skill_bullets(categorized['soft'])
             
             with col3:
                 st.subheader(f"🛠️ Tools ({len(categorized['tools'])})")
-                for skill in sorted(categorized['tools']):
-                    st.write(f"• {skill}")
+                _skill_bullets(categorized['tools'])
         
         with tab3:
             st.subheader("🔑 Important Keywords")
             if keywords:
-                for kw in keywords:
-                    st.write(f"• {kw}")
+                _skill_bullets(keywords)
             else:
                 st.info("No specific ATS keywords detected")
             
@@ -1048,33 +1451,19 @@ else:  # option == "🎯 Advanced Analytics"
     
     st.subheader("📊 Advanced Resume Analysis Tools")
     
-    # Tool selection with more options
-    analysis_tool = st.radio("Select Analysis Tool", [
-        "Resume Health Score",
-        "Career Trajectory",
-        "Competitive Analysis",
-        "Skill Gap & Roadmap",
-        "Industry Comparison",
-        "Salary Negotiation",
-        "Learning Recommendations",
-        "Market Insights"
-    ], horizontal=True)
-    
-    st.divider()
-    
+    # Each tool renders through its own function, looked up from the selected name below
     # Tool 1: Resume Health Score
-    if analysis_tool == "Resume Health Score":
+    def _render_health_score():
         st.markdown("### 🏥 Complete Resume Health Assessment")
         
         uploaded_file = st.file_uploader("Upload your resume", type="pdf", key="health_resume")
         
         if uploaded_file:
-            resume_text = extract_text_from_pdf(uploaded_file)
-            resume_skills = extract_skills(resume_text, default_skills)
-            experience = extract_experience(resume_text)
-            education = extract_education(resume_text)
-            contact_info = extract_contact_info(resume_text)
-            quality_score, quality_issues, quality_analysis = analyze_resume_quality(resume_text, resume_skills, experience, education)
+            profile = _cached_resume_profile(_upload_digest(uploaded_file), uploaded_file)
+            resume_text, resume_skills = profile["resume_text"], profile["resume_skills"]
+            experience, education = profile["experience"], profile["education"]
+            contact_info = profile["contact_info"]
+            quality_score, quality_issues, quality_analysis = profile["quality"]
             
             # Overall Health Score
             col1, col2, col3, col4 = st.columns(4)
@@ -1108,33 +1497,28 @@ else:  # option == "🎯 Advanced Analytics"
             
             with col2:
                 st.subheader("🎯 Quality Analysis Breakdown")
-                analysis_items = [
-                    ("Length", quality_analysis.get('Length', 'N/A')),
-                    ("Skills", quality_analysis.get('Skills', 'N/A')),
-                    ("Experience", quality_analysis.get('Experience', 'N/A')),
-                    ("Education", quality_analysis.get('Education', 'N/A')),
-                    ("Contact", quality_analysis.get('Contact', 'N/A')),
-                ]
-                for item, value in analysis_items:
-                    st.write(f"**{item}:** {value}")
+                st.markdown("  \n".join(
+                    f"**{item}:** {quality_analysis.get(item, 'N/A')}"
+                    for item in ("Length", "Skills", "Experience", "Education", "Contact")
+                ))
             
             st.divider()
             
             st.subheader("💡 Improvement Recommendations")
             recommendations = get_improvement_suggestions(resume_skills, default_skills, experience, quality_issues)
-            for i, rec in enumerate(recommendations, 1):
-                st.info(f"{i}. {rec}")
+            if recommendations:
+                st.info("  \n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1)))
     
     # Tool 2: Career Trajectory
-    elif analysis_tool == "Career Trajectory":
+    def _render_career_trajectory():
         st.markdown("### 📈 Your Career Growth Path")
         
         uploaded_file = st.file_uploader("Upload your resume", type="pdf", key="trajectory_resume")
         
         if uploaded_file:
-            resume_text = extract_text_from_pdf(uploaded_file)
-            resume_skills = extract_skills(resume_text, default_skills)
-            experience = extract_experience(resume_text)
+            profile = _cached_resume_profile(_upload_digest(uploaded_file), uploaded_file)
+            resume_text, resume_skills = profile["resume_text"], profile["resume_skills"]
+            experience = profile["experience"]
             
             # Career progression simulation
             current_level = "Junior" if experience < 3 else "Mid-Level" if experience < 7 else "Senior"
@@ -1148,53 +1532,29 @@ else:  # option == "🎯 Advanced Analytics"
             st.divider()
             
             # Salary progression chart
-            years = list(range(0, 15))
-            junior_progression = [80 + (i * 8) for i in years]
-            mid_progression = [130 + (i * 10) for i in years]
-            senior_progression = [200 + (i * 15) for i in years]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=years, y=junior_progression, mode='lines+markers', name='Junior Track', line=dict(color='#3498db', width=2)))
-            fig.add_trace(go.Scatter(x=years, y=mid_progression, mode='lines+markers', name='Mid-Level Track', line=dict(color='#2ecc71', width=2)))
-            fig.add_trace(go.Scatter(x=years, y=senior_progression, mode='lines+markers', name='Senior Track', line=dict(color='#e74c3c', width=2)))
-            
-            fig.update_layout(
-                title="Projected Salary Growth by Career Path",
-                xaxis_title="Years of Experience",
-                yaxis_title="Annual Salary (USD, Thousands)",
-                hovermode='x unified',
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_salary_tracks_fig(), use_container_width=True)
             
             st.divider()
             
             # Progression milestones
             st.subheader("🎯 Career Progression Milestones")
             
-            milestones = {
-                "0-2 Years": ["Learn core tech stack", "Build 2-3 projects", "Contribute to open source"],
-                "2-5 Years": ["Tech leadership", "Mentor juniors", "Architecture decisions"],
-                "5-10 Years": ["Senior/Lead role", "Strategic thinking", "Team management"],
-                "10+ Years": ["Director/Principal", "Industry influence", "Technology strategy"]
-            }
-            
-            for period, items in milestones.items():
+            for period, items in CAREER_MILESTONES.items():
                 with st.expander(f"📌 {period}"):
                     for item in items:
                         st.write(f"✓ {item}")
     
     # Tool 3: Competitive Analysis
-    elif analysis_tool == "Competitive Analysis":
+    def _render_competitive_analysis():
         st.markdown("### 🏆 How You Stack Up in the Market")
         
         uploaded_file = st.file_uploader("Upload your resume", type="pdf", key="competitive_resume")
         
         if uploaded_file:
-            resume_text = extract_text_from_pdf(uploaded_file)
-            resume_skills = extract_skills(resume_text, default_skills)
-            experience = extract_experience(resume_text)
-            quality_score, _, _ = analyze_resume_quality(resume_text, resume_skills, experience, extract_education(resume_text))
+            profile = _cached_resume_profile(_upload_digest(uploaded_file), uploaded_file)
+            resume_text, resume_skills = profile["resume_text"], profile["resume_skills"]
+            experience = profile["experience"]
+            quality_score = profile["quality"][0]
             
             # Competitive metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -1217,27 +1577,15 @@ else:  # option == "🎯 Advanced Analytics"
             # Competitive positioning
             st.subheader("📊 Market Positioning Analysis")
             
-            metrics = ['Technical Skills', 'Experience', 'Resume Quality', 'Education', 'Certifications']
-            your_scores = [
+            # Every axis is clipped to the radar's 0-100 range in one pass
+            your_scores = np.clip(np.array([
                 (len(resume_skills) / 20) * 100,  # Technical skills
-                min(100, experience * 10),  # Experience
+                experience * 10,  # Experience
                 quality_score,  # Resume quality
                 85,  # Education (assuming good)
                 60  # Certifications
-            ]
-            market_avg = [75, 70, 65, 80, 50]
-            
-            fig = go.Figure(data=[
-                go.Scatterpolar(r=your_scores, theta=metrics, fill='toself', name='You', line=dict(color='#3498db')),
-                go.Scatterpolar(r=market_avg, theta=metrics, fill='toself', name='Market Average', line=dict(color='#95a5a6'))
-            ])
-            fig.update_layout(
-                polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-                showlegend=True,
-                height=400,
-                title="Skills & Experience Radar"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            ], dtype=np.float64), 0, 100)
+            st.plotly_chart(_market_radar_fig(your_scores), use_container_width=True)
             
             st.divider()
             
@@ -1250,7 +1598,7 @@ else:  # option == "🎯 Advanced Analytics"
                 st.success(f"✓ High-quality resume ({quality_score:.0f}/100)")
     
     # Tool 4: Skill Gap & Roadmap
-    elif analysis_tool == "Skill Gap & Roadmap":
+    def _render_skill_gap_roadmap():
         st.markdown("### 🛣️ Personalized Learning Roadmap")
         
         col1, col2 = st.columns(2)
@@ -1273,16 +1621,10 @@ else:  # option == "🎯 Advanced Analytics"
         st.divider()
         
         # Generate personalized roadmap
-        role_skills = {
-            "Full Stack Developer": ["React", "Node.js", "MongoDB", "AWS", "Docker"],
-            "Data Scientist": ["Machine Learning", "TensorFlow", "Spark", "Statistics", "Python"],
-            "DevOps Engineer": ["Kubernetes", "Docker", "Terraform", "Jenkins", "AWS"],
-            "Cloud Architect": ["AWS", "Azure", "Terraform", "Architecture", "Security"],
-            "Backend Developer": ["Django", "FastAPI", "PostgreSQL", "REST API", "Docker"]
-        }
-        
-        required_skills = role_skills.get(target_role, [])
-        missing_skills = [s for s in required_skills if s not in current_skills]
+        required_skills = ROADMAP_ROLE_SKILLS.get(target_role, [])
+        # Set lookup, list order kept for the month-by-month plan
+        known_skills = set(current_skills)
+        missing_skills = [s for s in required_skills if s not in known_skills]
         
         st.subheader(f"📚 Learning Roadmap for {target_role}")
         
@@ -1305,18 +1647,11 @@ else:  # option == "🎯 Advanced Analytics"
         
         st.subheader("🎓 Recommended Learning Resources")
         
-        resources = {
-            "Online Courses": ["Udemy", "Coursera", "DataCamp", "Pluralsight", "LinkedIn Learning"],
-            "Hands-On Practice": ["GitHub Projects", "LeetCode", "HackerRank", "Codewars"],
-            "Documentation": ["Official Docs", "Dev.to", "Medium", "Stack Overflow"],
-            "Communities": ["Discord", "Reddit", "Dev Communities", "Meetup Groups"]
-        }
-        
-        for category, platforms in resources.items():
+        for category, platforms in LEARNING_RESOURCES.items():
             st.markdown(f"**{category}:** {', '.join(platforms)}")
     
     # Tool 5: Industry Comparison
-    elif analysis_tool == "Industry Comparison":
+    def _render_industry_comparison():
         st.markdown("### 🌍 Cross-Industry Salary & Opportunity Analysis")
         
         col1, col2 = st.columns(2)
@@ -1337,51 +1672,18 @@ else:  # option == "🎯 Advanced Analytics"
         st.divider()
         
         # Industry salary comparison
-        industries = {
-            "Tech": {"min": 140, "avg": 180, "max": 280},
-            "Finance": {"min": 160, "avg": 210, "max": 320},
-            "Healthcare Tech": {"min": 130, "avg": 170, "max": 260},
-            "E-Commerce": {"min": 125, "avg": 165, "max": 250},
-            "Startup": {"min": 100, "avg": 140, "max": 220}
-        }
-        
         st.subheader("💰 Salary Comparison by Industry")
-        
-        industry_names = list(industries.keys())
-        avg_salaries = [industries[ind]["avg"] for ind in industry_names]
-        min_salaries = [industries[ind]["min"] for ind in industry_names]
-        max_salaries = [industries[ind]["max"] for ind in industry_names]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Bar(x=industry_names, y=min_salaries, name='Min', marker_color='#e74c3c'))
-        fig.add_trace(go.Bar(x=industry_names, y=avg_salaries, name='Average', marker_color='#3498db'))
-        fig.add_trace(go.Bar(x=industry_names, y=max_salaries, name='Max', marker_color='#2ecc71'))
-        
-        fig.update_layout(
-            title=f"Salary Range by Industry ({experience_level})",
-            yaxis_title="Annual Salary (USD, Thousands)",
-            barmode='group',
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_industry_salary_fig(experience_level), use_container_width=True)
         
         st.divider()
         
         st.subheader("📊 Industry Insights")
         
-        insights = {
-            "Tech": "Highest salaries, strong demand for Python/AWS skills, remote opportunities",
-            "Finance": "Premium salaries, strict requirements, strong security focus",
-            "Healthcare Tech": "Growing sector, mission-driven, good work-life balance",
-            "E-Commerce": "Fast-paced, competitive, strong focus on scalability",
-            "Startup": "Lower base but equity, high growth potential, learning opportunity"
-        }
-        
-        for industry, insight in insights.items():
+        for industry, insight in INDUSTRY_INSIGHTS.items():
             st.info(f"**{industry}:** {insight}")
     
     # Tool 6: Salary Negotiation
-    elif analysis_tool == "Salary Negotiation":
+    def _render_salary_negotiation():
         st.markdown("### 💬 Smart Salary Negotiation Guide")
         
         col1, col2, col3 = st.columns(3)
@@ -1443,33 +1745,28 @@ else:  # option == "🎯 Advanced Analytics"
         st.divider()
         
         st.subheader("📋 Salary Negotiation Checklist")
-        checklist = [
-            "Researched market salary data",
-            "Know company's budget range",
-            "Documented career achievements",
-            "Prepared negotiation talking points",
-            "Know minimum acceptable salary",
-            "Understand benefits package value",
-            "Practiced negotiation conversation",
-            "Have backup job offers"
-        ]
-        
-        for item in checklist:
-            st.checkbox(item)
+        # One editable table instead of a widget per item
+        st.data_editor(
+            pd.DataFrame({"Done": [False] * len(NEGOTIATION_CHECKLIST), "Task": NEGOTIATION_CHECKLIST}),
+            hide_index=True,
+            disabled=["Task"],
+            use_container_width=True,
+            key="negotiation_checklist"
+        )
     
     # Tool 7: Learning Recommendations
-    elif analysis_tool == "Learning Recommendations":
+    def _render_learning_recommendations():
         st.markdown("### 🎓 AI-Powered Learning Recommendations")
         
         uploaded_file = st.file_uploader("Upload your resume", type="pdf", key="learning_resume")
         job_desc = st.text_area("Target job description (optional)", height=150)
         
         if uploaded_file:
-            resume_text = extract_text_from_pdf(uploaded_file)
-            resume_skills = extract_skills(resume_text, default_skills)
+            profile = _cached_resume_profile(_upload_digest(uploaded_file), uploaded_file)
+            resume_text, resume_skills = profile["resume_text"], profile["resume_skills"]
             
             if job_desc:
-                job_skills = extract_job_requirements(job_desc)
+                job_skills = _cached_job_requirements(job_desc)
             else:
                 job_skills = default_skills
             
@@ -1512,7 +1809,7 @@ else:  # option == "🎯 Advanced Analytics"
                 st.success("✓ You have most required skills! Focus on advanced concepts.")
     
     # Tool 8: Market Insights
-    else:  # Market Insights
+    def _render_market_insights():
         st.markdown("### 📈 Deep Market Insights & Trends")
         
         col1, col2 = st.columns(2)
@@ -1533,16 +1830,9 @@ else:  # option == "🎯 Advanced Analytics"
         
         st.subheader("🔥 Hot Skills in Demand")
         
-        hot_skills = {
-            "Tech": ["AI/ML", "Cloud (AWS/Azure)", "DevOps", "GoLang", "Rust"],
-            "Finance": ["Python", "SQL", "Risk Analytics", "Cybersecurity", "Blockchain"],
-            "Healthcare": ["Python", "Healthcare IT", "HIPAA", "Data Analysis", "Cloud"],
-            "E-Commerce": ["Golang", "Kubernetes", "React", "ELK Stack", "NoSQL"],
-            "Startups": ["Full Stack", "Growth", "SaaS", "Mobile", "AI/ML"]
-        }
-        
+        industry_skills = HOT_SKILLS_BY_INDUSTRY.get(selected_industry, [])
         skill_demand = st.slider("Show top N skills", 3, 10, 5)
-        skills = hot_skills.get(selected_industry, [])[:skill_demand]
+        skills = industry_skills[:skill_demand]
         
         cols = st.columns(len(skills))
         for i, skill in enumerate(skills):
@@ -1553,21 +1843,11 @@ else:  # option == "🎯 Advanced Analytics"
         
         st.subheader("💼 Job Market Statistics")
         
-        stats = {
-            "Average Salary Growth": "+8-12% YoY",
-            "Hiring Trend": "↑ Strong Growth",
-            "Remote Opportunities": "45-60% fully remote",
-            "Average Interview Time": "3-4 weeks",
-            "Avg Applications for Hire": "50-100 candidates",
-            "Most Requested Seniority": "Mid-Level (3-7 years)"
-        }
-        
-        col1, col2, col3 = st.columns(3)
-        cols = [col1, col2, col3]
-        
-        for i, (stat, value) in enumerate(stats.items()):
-            with cols[i % 3]:
-                st.metric(stat, value)
+        st.dataframe(
+            pd.DataFrame(list(JOB_MARKET_STATS.items()), columns=["Metric", "Value"]),
+            hide_index=True,
+            use_container_width=True
+        )
         
         st.divider()
         
@@ -1584,4 +1864,21 @@ else:  # option == "🎯 Advanced Analytics"
         7. **Timeline:** Start job searches 2-3 months in advance
         8. **Growth:** Plan skill upgrades every 6 months
         """)
-
+    
+    advanced_tools = {
+        "Resume Health Score": _render_health_score,
+        "Career Trajectory": _render_career_trajectory,
+        "Competitive Analysis": _render_competitive_analysis,
+        "Skill Gap & Roadmap": _render_skill_gap_roadmap,
+        "Industry Comparison": _render_industry_comparison,
+        "Salary Negotiation": _render_salary_negotiation,
+        "Learning Recommendations": _render_learning_recommendations,
+        "Market Insights": _render_market_insights,
+    }
+    
+    # Tool selection with more options
+    analysis_tool = st.radio("Select Analysis Tool", list(advanced_tools), horizontal=True)
+    
+    st.divider()
+    
+    advanced_tools[analysis_tool]()
@@ -315,6 +315,15 @@ INDUSTRY_SALARY_DATA = {
     },
 }
 
+SALARY_LEVELS = ('Entry Level', 'Junior', 'Mid-Level', 'Senior', 'Staff+')
+
+# (industry, level) -> (min, avg, max); levels an industry doesn't list fall back to Mid-Level
+SALARY_BANDS = {
+    (industry, level): tuple(levels.get(level, levels['Mid-Level'])[key] for key in ('min', 'avg', 'max'))
+    for industry, levels in INDUSTRY_SALARY_DATA.items()
+    for level in SALARY_LEVELS
+}
+
 # ============================================================================
 # SKILL ALIASES & VARIATIONS
 # ============================================================================
@@ -336,6 +345,14 @@ SKILL_ALIASES = {
     'oop': ['object oriented programming'],
 }
 
+# Reverse index: alias -> canonical skill. Built from the last entry back so that,
+# as with a front-to-back scan, the first canonical listing an alias wins.
+ALIAS_TO_CANONICAL = {
+    alias: canonical
+    for canonical, aliases in reversed(SKILL_ALIASES.items())
+    for alias in aliases
+}
+
 # ============================================================================
 # SALARY MULTIPLIERS BY SKILL (Skill Premium Analysis)
 # ============================================================================
@@ -468,3 +485,73 @@ INDUSTRY_STANDARDS = {
     'avg_salary_increase_per_year': '3-5%',
     'promotion_timeline': '2-3 years',
 }
+
+# ============================================================================
+# ADVANCED ANALYTICS REFERENCE DATA
+# ============================================================================
+
+INDUSTRY_SALARY_RANGES = {
+    "Tech": {"min": 140, "avg": 180, "max": 280},
+    "Finance": {"min": 160, "avg": 210, "max": 320},
+    "Healthcare Tech": {"min": 130, "avg": 170, "max": 260},
+    "E-Commerce": {"min": 125, "avg": 165, "max": 250},
+    "Startup": {"min": 100, "avg": 140, "max": 220}
+}
+
+INDUSTRY_INSIGHTS = {
+    "Tech": "Highest salaries, strong demand for Python/AWS skills, remote opportunities",
+    "Finance": "Premium salaries, strict requirements, strong security focus",
+    "Healthcare Tech": "Growing sector, mission-driven, good work-life balance",
+    "E-Commerce": "Fast-paced, competitive, strong focus on scalability",
+    "Startup": "Lower base but equity, high growth potential, learning opportunity"
+}
+
+HOT_SKILLS_BY_INDUSTRY = {
+    "Tech": ["AI/ML", "Cloud (AWS/Azure)", "DevOps", "GoLang", "Rust"],
+    "Finance": ["Python", "SQL", "Risk Analytics", "Cybersecurity", "Blockchain"],
+    "Healthcare": ["Python", "Healthcare IT", "HIPAA", "Data Analysis", "Cloud"],
+    "E-Commerce": ["Golang", "Kubernetes", "React", "ELK Stack", "NoSQL"],
+    "Startups": ["Full Stack", "Growth", "SaaS", "Mobile", "AI/ML"]
+}
+
+JOB_MARKET_STATS = {
+    "Average Salary Growth": "+8-12% YoY",
+    "Hiring Trend": "↑ Strong Growth",
+    "Remote Opportunities": "45-60% fully remote",
+    "Average Interview Time": "3-4 weeks",
+    "Avg Applications for Hire": "50-100 candidates",
+    "Most Requested Seniority": "Mid-Level (3-7 years)"
+}
+
+CAREER_MILESTONES = {
+    "0-2 Years": ["Learn core tech stack", "Build 2-3 projects", "Contribute to open source"],
+    "2-5 Years": ["Tech leadership", "Mentor juniors", "Architecture decisions"],
+    "5-10 Years": ["Senior/Lead role", "Strategic thinking", "Team management"],
+    "10+ Years": ["Director/Principal", "Industry influence", "Technology strategy"]
+}
+
+ROADMAP_ROLE_SKILLS = {
+    "Full Stack Developer": ["React", "Node.js", "MongoDB", "AWS", "Docker"],
+    "Data Scientist": ["Machine Learning", "TensorFlow", "Spark", "Statistics", "Python"],
+    "DevOps Engineer": ["Kubernetes", "Docker", "Terraform", "Jenkins", "AWS"],
+    "Cloud Architect": ["AWS", "Azure", "Terraform", "Architecture", "Security"],
+    "Backend Developer": ["Django", "FastAPI", "PostgreSQL", "REST API", "Docker"]
+}
+
+LEARNING_RESOURCES = {
+    "Online Courses": ["Udemy", "Coursera", "DataCamp", "Pluralsight", "LinkedIn Learning"],
+    "Hands-On Practice": ["GitHub Projects", "LeetCode", "HackerRank", "Codewars"],
+    "Documentation": ["Official Docs", "Dev.to", "Medium", "Stack Overflow"],
+    "Communities": ["Discord", "Reddit", "Dev Communities", "Meetup Groups"]
+}
+
+NEGOTIATION_CHECKLIST = [
+    "Researched market salary data",
+    "Know company's budget range",
+    "Documented career achievements",
+    "Prepared negotiation talking points",
+    "Know minimum acceptable salary",
+    "Understand benefits package value",
+    "Practiced negotiation conversation",
+    "Have backup job offers"
+]
@@ -1,65 +1,68 @@
-# Predefined skill sets for different job roles
-JOB_PROFILES = {
-    "Full Stack Developer": [
+from types import MappingProxyType
+
+# Predefined skill sets for different job roles. Named apart from the detailed
+# industry_data.JOB_PROFILES; a read-only mapping of tuples so callers cannot mutate the shared table.
+JOB_PROFILE_SKILLS = MappingProxyType({
+    "Full Stack Developer": (
         "Python", "JavaScript", "React", "Node.js", "SQL", "MongoDB",
         "Git", "Docker", "AWS", "REST API", "HTML", "CSS", "TypeScript",
         "Express", "Problem Solving", "Communication", "Teamwork"
-    ],
+    ),
     
-    "Data Scientist": [
+    "Data Scientist": (
         "Python", "SQL", "Machine Learning", "TensorFlow", "PyTorch",
         "Pandas", "NumPy", "Scikit-learn", "Data Analysis", "Statistics",
         "Tableau", "Power BI", "Deep Learning", "AI", "Communication"
-    ],
+    ),
     
-    "DevOps Engineer": [
+    "DevOps Engineer": (
         "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Linux", "Git",
         "Jenkins", "CI/CD", "Bash", "Python", "Terraform", "Ansible",
         "Problem Solving", "Leadership", "Communication"
-    ],
+    ),
     
-    "Frontend Developer": [
+    "Frontend Developer": (
         "JavaScript", "React", "Vue", "Angular", "HTML", "CSS", "TypeScript",
         "Git", "REST API", "Webpack", "npm", "Communication", "Teamwork",
         "Problem Solving", "UI/UX", "Design Patterns"
-    ],
+    ),
     
-    "Backend Developer": [
+    "Backend Developer": (
         "Python", "Java", "Node.js", "SQL", "REST API", "Django", "Flask",
         "Spring Boot", "Git", "Docker", "Microservices", "Communication",
         "Problem Solving", "Database Design"
-    ],
+    ),
     
-    "Software Engineer": [
+    "Software Engineer": (
         "Java", "C++", "Python", "SQL", "Git", "Agile", "Problem Solving",
         "Data Structures", "Algorithms", "Leadership", "Communication",
         "Code Review", "Testing", "Scrum"
-    ],
+    ),
     
-    "Cloud Architect": [
+    "Cloud Architect": (
         "AWS", "Azure", "GCP", "Cloud", "Docker", "Kubernetes", "Linux",
         "Terraform", "Security", "Design Patterns", "Leadership",
         "Communication", "Problem Solving", "DevOps"
-    ],
+    ),
     
-    "QA Engineer": [
+    "QA Engineer": (
         "Testing", "Automation", "Python", "JavaScript", "Selenium", "JIRA",
         "Problem Solving", "Communication", "Attention to Detail",
         "Test Planning", "SQL", "Git", "DevOps", "CI/CD"
-    ],
+    ),
     
-    "Product Manager": [
+    "Product Manager": (
         "Leadership", "Communication", "Project Management", "Agile",
         "Stakeholder Management", "Data Analysis", "Product Strategy",
         "Problem Solving", "Critical Thinking", "Analytics", "Tableau"
-    ],
+    ),
     
-    "Data Engineer": [
+    "Data Engineer": (
         "Python", "SQL", "Spark", "Hadoop", "Kafka", "AWS", "Data Warehousing",
         "ETL", "Scala", "Git", "Docker", "Problem Solving", "Communication",
         "Airflow", "NoSQL"
-    ]
-}
+    )
+})
 
 # Industry-specific keywords
 INDUSTRY_KEYWORDS = {
@@ -100,11 +103,11 @@ SENIORITY_LEVELS = {
 
 def get_job_profile_skills(job_title):
     """Get predefined skills for a job title."""
-    return JOB_PROFILES.get(job_title, [])
+    return JOB_PROFILE_SKILLS.get(job_title, ())
 
 def get_all_job_profiles():
     """Get all available job profiles."""
-    return list(JOB_PROFILES.keys())
+    return list(JOB_PROFILE_SKILLS.keys())
 
 def get_industry_keywords(industry):
     """Get keywords for a specific industry."""
@@ -1,14 +1,44 @@
 #!/usr/bin/env python
 """Final comprehensive test - simulates app.py code flow"""
+import heapq
+from collections import Counter
+from io import BytesIO
+from PyPDF2 import PageObject, PdfWriter
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject
+from industry_data import JOB_PROFILES
 from utils import (
     extract_text_from_pdf, extract_skills, calculate_match,
     extract_experience, extract_education, categorize_skills,
     analyze_resume_quality, get_improvement_suggestions,
     get_skill_gaps, match_certifications, predict_salary,
     get_interview_readiness_score, get_career_progression_path,
-    calculate_weighted_match_score
+    calculate_weighted_match_score, extract_pdf_text, MAX_PDF_PAGES,
+    normalize_skill, score_job_profiles, JOB_PROFILE_ROLES
 )
 
+
+def make_pdf(page_count):
+    """Build an in-memory PDF with one line of text per page."""
+    writer = PdfWriter()
+    font = DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    })
+    for number in range(1, page_count + 1):
+        page = PageObject.create_blank_page(width=612, height=792)
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td (Resume page {number}) Tj ET".encode("latin-1"))
+        page[NameObject("/Contents")] = content
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})
+        })
+        writer.add_page(page)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
 print("="*60)
 print("COMPREHENSIVE APP FLOW TEST")
 print("="*60)
@@ -160,6 +190,28 @@ suggestions = get_improvement_suggestions(
 )
 print(f"  - Suggestions: {len(suggestions)}")
 
+print("\n✓ Step 15: PDF page cap (UNPACKING 2 VALUES)")
+long_text, long_truncated = extract_pdf_text(make_pdf(MAX_PDF_PAGES + 2))
+short_text, short_truncated = extract_pdf_text(make_pdf(1))
+print(f"  - {MAX_PDF_PAGES + 2}-page PDF: {len(long_text.splitlines())} pages read, truncated={long_truncated}")
+print(f"  - 1-page PDF: {len(short_text.splitlines())} page read, truncated={short_truncated}")
+if not long_truncated or short_truncated or len(long_text.splitlines()) != MAX_PDF_PAGES:
+    print("  ✗ ERROR: truncation flag does not match the page cap")
+    exit(1)
+
+print("\n✓ Step 16: Vectorized job profile ranking")
+role_scores = score_job_profiles(Counter(normalize_skill(s) for s in resume_skills))['match_score']
+top_roles = [JOB_PROFILE_ROLES[i] for i in heapq.nlargest(5, range(len(JOB_PROFILE_ROLES)), key=role_scores.__getitem__)]
+reference_scores = {
+    role: calculate_match(resume_skills, profile['required_skills']['critical'] + profile['required_skills']['required'])[0]
+    for role, profile in JOB_PROFILES.items()
+}
+reference_top = sorted(reference_scores, key=reference_scores.get, reverse=True)[:5]
+print(f"  - Top roles: {top_roles}")
+if top_roles != reference_top or any(role_scores[JOB_PROFILE_ROLES.index(r)] != reference_scores[r] for r in top_roles):
+    print(f"  ✗ ERROR: expected {reference_top} from calculate_match")
+    exit(1)
+
 print("\n" + "="*60)
 print("✅ ALL TESTS PASSED - NO UNPACKING ERRORS")
 print("="*60)
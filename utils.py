@@ -5,11 +5,13 @@ Updated 2024-2026 with real market data
 """
 
 import re
-from PyPDF2 import PdfReader
+from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
+import numpy as np
 from industry_data import (
     TECHNICAL_SKILLS, SOFT_SKILLS, CREATIVE_SKILLS, JOB_PROFILES,
-    INDUSTRY_SALARY_DATA, SKILL_ALIASES, SKILL_MULTIPLIERS,
+    INDUSTRY_SALARY_DATA, SALARY_BANDS, SKILL_ALIASES, ALIAS_TO_CANONICAL, SKILL_MULTIPLIERS,
     LEARNING_PATHS, QUALITY_RUBRIC, CERTIFICATIONS_BY_INDUSTRY
 )
 
@@ -17,8 +19,17 @@ from industry_data import (
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def extract_text_from_pdf(pdf_file):
-    """Extract text from PDF with robust error handling."""
+# Resumes are one or two pages; a stray thesis or portfolio should not dominate
+# parsing time or the downstream text scans, so only the head of the PDF is read.
+MAX_PDF_PAGES = 4
+MAX_PDF_CHARS = 40_000
+
+
+def extract_pdf_text(pdf_file, max_pages=MAX_PDF_PAGES, max_chars=MAX_PDF_CHARS):
+    """Extract text from PDF, returning (text, truncated)."""
+    # PyPDF2 is most of this module's import time; load it only when a PDF is parsed
+    from PyPDF2 import PdfReader
+
     try:
         if isinstance(pdf_file, bytes):
             pdf_reader = PdfReader(BytesIO(pdf_file))
@@ -26,48 +37,81 @@ def extract_text_from_pdf(pdf_file):
             pdf_reader = PdfReader(pdf_file)
         
         if len(pdf_reader.pages) == 0:
-            return "Error: PDF has no pages"
+            return "Error: PDF has no pages", False
         
-        text = ""
-        for page in pdf_reader.pages:
+        # Collect page texts and join once rather than re-copying the string per page,
+        # stopping early once the page or character budget is spent
+        page_texts = []
+        total_chars = 0
+        truncated = len(pdf_reader.pages) > max_pages
+        for page in pdf_reader.pages[:max_pages]:
             try:
-                text += page.extract_text() + "\n"
+                page_text = page.extract_text() + "\n"
             except Exception:
                 continue
+            page_texts.append(page_text)
+            total_chars += len(page_text)
+            if total_chars > max_chars:
+                truncated = True
+                break
         
-        return text.strip() if text.strip() else "Error: Could not extract text"
+        text = "".join(page_texts)[:max_chars].strip()
+        return (text, truncated) if text else ("Error: Could not extract text", False)
     except Exception as e:
-        return f"Error extracting PDF: {str(e)}"
+        return f"Error extracting PDF: {str(e)}", False
 
 
+def extract_text_from_pdf(pdf_file):
+    """Extract text from PDF with robust error handling."""
+    return extract_pdf_text(pdf_file)[0]
+
+
+@lru_cache(maxsize=4096)
 def normalize_skill(skill):
     """Normalize skill name for comparison."""
+    # Skill names come from a small vocabulary, so repeated calls are cache hits
+    # instead of two fresh string allocations
     return skill.lower().strip()
 
 
+# Normalized skill-name sets for O(1) membership checks, built once at import
+TECHNICAL_SKILL_NORMS = frozenset(normalize_skill(s) for s in TECHNICAL_SKILLS)
+SOFT_SKILL_NORMS = frozenset(normalize_skill(s) for s in SOFT_SKILLS)
+
+# Normalized name -> canonical display name, per category (used by categorize_skills)
+TECHNICAL_NORM_TO_NAME = {normalize_skill(k): k for k in TECHNICAL_SKILLS}
+SOFT_NORM_TO_NAME = {normalize_skill(k): k for k in SOFT_SKILLS}
+CREATIVE_NORM_TO_NAME = {normalize_skill(k): k for k in CREATIVE_SKILLS}
+
+# Default extraction universe (technical + soft) and the full industry universe (+ creative)
+TECH_SOFT_SKILLS = tuple(TECHNICAL_SKILLS.keys()) + tuple(SOFT_SKILLS.keys())
+ALL_INDUSTRY_SKILLS = TECH_SOFT_SKILLS + tuple(CREATIVE_SKILLS.keys())
+
+# Heuristic: common soft skills to exclude
+SOFT_SKILL_KEYWORDS = frozenset({
+    'communication', 'leadership', 'teamwork', 'collaboration',
+    'problem solving', 'project management', 'time management',
+    'critical thinking', 'negotiation', 'presentation', 'mentoring',
+    'adaptability', 'creativity', 'emotional intelligence'
+})
+
+
 def is_technical_skill(skill):
     """Check if a skill is technical (not soft skill)."""
-    skill_norm = normalize_skill(skill)
-    
+    return _is_technical_norm(normalize_skill(skill))
+
+
+def _is_technical_norm(skill_norm):
+    """is_technical_skill for an already-normalized skill name."""
     # Check if it's in technical skills database
-    for tech_skill in TECHNICAL_SKILLS.keys():
-        if normalize_skill(tech_skill) == skill_norm:
-            return True
+    if skill_norm in TECHNICAL_SKILL_NORMS:
+        return True
     
     # Check against soft skills - if it's in soft skills, it's not technical
-    for soft_skill in SOFT_SKILLS.keys():
-        if normalize_skill(soft_skill) == skill_norm:
-            return False
-    
-    # Heuristic: common soft skills to exclude
-    soft_skill_keywords = {
-        'communication', 'leadership', 'teamwork', 'collaboration',
-        'problem solving', 'project management', 'time management',
-        'critical thinking', 'negotiation', 'presentation', 'mentoring',
-        'adaptability', 'creativity', 'emotional intelligence'
-    }
+    if skill_norm in SOFT_SKILL_NORMS:
+        return False
     
-    return skill_norm not in soft_skill_keywords
+    return skill_norm not in SOFT_SKILL_KEYWORDS
 
 
 def filter_technical_skills(skills):
@@ -84,13 +128,32 @@ def expand_skill_with_aliases(skill):
         return [skill_norm] + SKILL_ALIASES[skill_norm]
     
     # Check if this skill is an alias of something else
-    for main_skill, aliases in SKILL_ALIASES.items():
-        if skill_norm in aliases:
-            return [main_skill] + aliases
+    main_skill = ALIAS_TO_CANONICAL.get(skill_norm)
+    if main_skill is not None:
+        return [main_skill] + SKILL_ALIASES[main_skill]
     
     return [skill_norm]
 
 
+@lru_cache(maxsize=1024)
+def _skill_aliases(skill_norm):
+    """Cached alias expansion for an already-normalized skill name."""
+    return tuple(expand_skill_with_aliases(skill_norm))
+
+
+@lru_cache(maxsize=64)
+def _skill_matchers(skills):
+    """Precompute (skill names, normalized name, space-prefixed aliases) per distinct normalized skill."""
+    names_by_norm = {}
+    for skill in skills:
+        names_by_norm.setdefault(normalize_skill(skill), []).append(skill)
+    # An alias containing the normalized name can only match where the name already does
+    return tuple(
+        (tuple(names), skill_norm, tuple(f' {alias}' for alias in _skill_aliases(skill_norm) if skill_norm not in alias))
+        for skill_norm, names in names_by_norm.items()
+    )
+
+
 def extract_skills(text, skills=None):
     """
     Extract skills with intelligent matching including aliases.
@@ -99,34 +162,34 @@ def extract_skills(text, skills=None):
     if not text or not isinstance(text, str):
         return []
     
+    return _extract_skills_lower(text.lower(), skills)
+
+
+def _extract_skills_lower(text_lower, skills=None):
+    """extract_skills on already-lowercased text."""
     # Use all technical + soft skills if not specified
     if skills is None:
-        all_skills = list(TECHNICAL_SKILLS.keys()) + list(SOFT_SKILLS.keys())
+        all_skills = TECH_SOFT_SKILLS
     else:
-        all_skills = list(skills)
+        all_skills = tuple(skills)
     
-    text_lower = text.lower()
+    # Pad the text once; an alias matches at the start of the text
+    # or after a space, the skill name itself anywhere
+    padded_text = f' {text_lower}'
     detected_skills = set()
     
-    for skill in all_skills:
-        skill_norm = normalize_skill(skill)
-        
-        # Check direct match
-        if skill_norm in text_lower:
-            detected_skills.add(skill)
-        
-        # Check with aliases
-        for alias in expand_skill_with_aliases(skill_norm):
-            if alias != skill_norm and f' {alias} ' in f' {text_lower} ':
-                detected_skills.add(skill)
-            elif f' {alias}' in text_lower or text_lower.startswith(alias):
-                detected_skills.add(skill)
-            elif text_lower.endswith(f' {alias}'):
-                detected_skills.add(skill)
+    for names, skill_norm, aliases in _skill_matchers(all_skills):
+        if skill_norm in text_lower or any(alias in padded_text for alias in aliases):
+            detected_skills.update(names)
     
     return sorted(list(detected_skills))
 
 
+def extract_skills_batch(texts, skills=None):
+    """Extract skills from each text in turn; the prepared skill matchers are built once and reused."""
+    return [extract_skills(text, skills) for text in texts]
+
+
 def extract_experience(text):
     """Extract years of experience with accuracy and fallback logic."""
     patterns = [
@@ -159,6 +222,11 @@ def extract_experience(text):
 
 def extract_education(text):
     """Extract education level with industry standards."""
+    return _education_from_lower(text.lower())
+
+
+def _education_from_lower(text_lower):
+    """extract_education on already-lowercased text."""
     education_mapping = {
         'PhD': ['phd', 'doctorate', 'doctor of philosophy', 'postdoctoral'],
         'Master': ['master\'?s?', 'ms', 'm.s', 'mba', 'mtech', 'm.tech'],
@@ -167,8 +235,6 @@ def extract_education(text):
         'High School': ['high school', 'secondary', 'h.s', 'hs'],
     }
     
-    text_lower = text.lower()
-    
     for degree, patterns in education_mapping.items():
         for pattern in patterns:
             if re.search(r'\b' + pattern + r'\b', text_lower):
@@ -177,6 +243,12 @@ def extract_education(text):
     return "Not Mentioned"
 
 
+# Contact patterns, compiled once at import
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[A-Za-z0-9-]+', re.IGNORECASE)
+
+
 def extract_contact_info(text):
     """Extract and validate contact information."""
     info = {
@@ -186,17 +258,17 @@ def extract_contact_info(text):
     }
     
     # Email pattern
-    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    email_match = EMAIL_PATTERN.search(text)
     if email_match:
         info['email'] = email_match.group(0)
     
     # Phone pattern
-    phone_match = re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', text)
+    phone_match = PHONE_PATTERN.search(text)
     if phone_match:
         info['phone'] = phone_match.group(0)
     
     # LinkedIn
-    linkedin_match = re.search(r'linkedin\.com/in/[A-Za-z0-9-]+', text, re.IGNORECASE)
+    linkedin_match = LINKEDIN_PATTERN.search(text)
     if linkedin_match:
         info['linkedin'] = linkedin_match.group(0)
     
@@ -209,9 +281,9 @@ def categorize_skills(skills):
     soft = []
     creative = []
     tools = []
-    tech_norm_to_name = {normalize_skill(k): k for k in TECHNICAL_SKILLS}
-    soft_norm_to_name = {normalize_skill(k): k for k in SOFT_SKILLS}
-    creative_norm_to_name = {normalize_skill(k): k for k in CREATIVE_SKILLS}
+    tech_norm_to_name = TECHNICAL_NORM_TO_NAME
+    soft_norm_to_name = SOFT_NORM_TO_NAME
+    creative_norm_to_name = CREATIVE_NORM_TO_NAME
 
     for skill in skills:
         sn = normalize_skill(skill)
@@ -233,100 +305,116 @@ def categorize_skills(skills):
     }
 
 
+ATS_KEYWORDS = (
+    'experience', 'responsibility', 'skill', 'requirement', 'qualification',
+    'lead', 'manage', 'develop', 'design', 'implement', 'bachelor', 'master'
+)
+
+
 def extract_keywords(text):
     """Extract important keywords from text."""
     keywords = []
     text_lower = text.lower()
     
-    ats_keywords = {
-        'experience', 'responsibility', 'skill', 'requirement', 'qualification',
-        'lead', 'manage', 'develop', 'design', 'implement', 'bachelor', 'master'
-    }
-    
-    for keyword in ats_keywords:
+    for keyword in ATS_KEYWORDS:
         if keyword in text_lower:
             keywords.append(keyword.title())
     
     return list(set(keywords))
 
 
+# Requirement section headers, skill-indicator phrases and per-role default skills
+# used by extract_job_requirements
+REQUIREMENT_PATTERNS = (
+    'required skills:', 'must have:', 'should have:', 'preferred skills:',
+    'looking for:', 'we need:', 'seeking:', 'responsibilities:', 'qualifications:',
+    'required:', 'preferred:', 'must:', 'skills needed:', 'technical skills:',
+    'you should have:', 'you will need:', 'requirement', 'key skills:', 'tools:'
+)
+
+SKILL_INDICATORS = (
+    'experience with', 'knowledge of', 'fluent in', 'skilled in',
+    'proficiency', 'familiar with', 'expertise in', 'work with', 'proficient in'
+)
+
+ROLE_DEFAULT_SKILLS = {
+    'Backend Developer': ['Python', 'Django', 'REST API', 'PostgreSQL', 'AWS', 'SQL', 'Git'],
+    'Frontend Developer': ['React', 'JavaScript', 'HTML', 'CSS', 'TypeScript', 'REST API', 'Git'],
+    'Full Stack Developer': ['React', 'Node.js', 'Python', 'SQL', 'AWS', 'Git', 'REST API', 'HTML', 'CSS'],
+    'DevOps Engineer': ['Docker', 'Kubernetes', 'AWS', 'Jenkins', 'Terraform', 'Linux', 'Git', 'CI/CD'],
+    'Cloud Architect': ['AWS', 'Azure', 'Google Cloud', 'Terraform', 'System Design', 'Security', 'Docker'],
+    'Data Scientist': ['Python', 'Machine Learning', 'SQL', 'TensorFlow', 'Pandas', 'Statistics', 'NumPy', 'Data Analysis'],
+    'Data Engineer': ['Python', 'SQL', 'Spark', 'Hadoop', 'AWS', 'ETL', 'Data Pipelines'],
+    'Data Analyst': ['SQL', 'Excel', 'Tableau', 'Python', 'Power BI', 'Data Analysis', 'Statistics'],
+    'QA Engineer': ['TestNG', 'Selenium', 'Automation', 'Java', 'Testing', 'Git', 'CI/CD'],
+    'Security Engineer': ['Linux', 'Cybersecurity', 'AWS', 'Encryption', 'Penetration Testing', 'Security'],
+    'Machine Learning Engineer': ['Python', 'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'SQL', 'Git'],
+    'ML Engineer': ['Python', 'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'SQL'],
+    'Software Engineer': ['Python', 'JavaScript', 'SQL', 'Git', 'REST API', 'Problem Solving'],
+    'Video Editor': ['Premiere Pro', 'After Effects', 'Video Editing', 'Motion Graphics', 'DaVinci Resolve', 'Color Grading'],
+    'Graphic Designer': ['Photoshop', 'Illustrator', 'Graphic Design', 'Figma', 'Canva', 'UI Design'],
+    'Content Writer': ['Content Writing', 'Copywriting', 'SEO', 'Communication'],
+    'Digital Marketing': ['Digital Marketing', 'SEO', 'Social Media Marketing', 'Content Writing', 'Google Analytics', 'Email Marketing'],
+    'Social Media Manager': ['Social Media Marketing', 'Content Writing', 'Communication', 'Canva'],
+    'Product Manager': ['Project Management', 'Communication', 'Problem Solving', 'SQL', 'Data Analysis', 'Agile'],
+    'Project Manager': ['Project Management', 'Communication', 'Leadership', 'Agile', 'Problem Solving'],
+    'Business Analyst': ['SQL', 'Excel', 'Data Analysis', 'Communication', 'Problem Solving'],
+    'Scrum Master': ['Agile', 'Project Management', 'Communication', 'Leadership'],
+    'iOS Developer': ['Swift', 'iOS', 'Git', 'REST API', 'Problem Solving'],
+    'Android Developer': ['Kotlin', 'Java', 'Git', 'REST API', 'Problem Solving'],
+    '.NET Developer': ['C#', 'SQL', 'REST API', 'Git', 'Problem Solving'],
+    'Technical Writer': ['Content Writing', 'Communication', 'Documentation', 'Technical Writing'],
+    'UX Designer': ['UX Design', 'Figma', 'User Research', 'Wireframing', 'Prototyping'],
+    'UI Designer': ['UI Design', 'Figma', 'Photoshop', 'Illustrator', 'Design Systems'],
+    'Motion Graphics Designer': ['After Effects', 'Motion Graphics', 'Premiere Pro', 'Cinematography'],
+    'Video Producer': ['Video Production', 'Premiere Pro', 'Video Editing', 'Project Management'],
+}
+
+# Joins text snippets so one extract_skills scan covers them all: no skill or alias
+# contains NUL, and the trailing space keeps each snippet's start a word boundary
+_SNIPPET_SEPARATOR = ' \x00 '
+
+
 def extract_job_requirements(job_description):
     """Extract skills from job description. Uses JD-only skills for non-tech roles (Video Editor, etc.)."""
     if not job_description or len(job_description.strip()) < 10:
         return []
 
     # Include creative/design/video skills so we detect Premiere Pro, After Effects, etc.
-    all_skills = list(TECHNICAL_SKILLS.keys()) + list(SOFT_SKILLS.keys()) + list(CREATIVE_SKILLS.keys())
+    all_skills = ALL_INDUSTRY_SKILLS
 
     job_lower = job_description.lower()
     detected_skills = set()
 
     # First pass: explicit requirement sections
-    requirement_patterns = [
-        'required skills:', 'must have:', 'should have:', 'preferred skills:',
-        'looking for:', 'we need:', 'seeking:', 'responsibilities:', 'qualifications:',
-        'required:', 'preferred:', 'must:', 'skills needed:', 'technical skills:',
-        'you should have:', 'you will need:', 'requirement', 'key skills:', 'tools:'
-    ]
     requirement_sections = []
-    for pattern in requirement_patterns:
-        if pattern in job_lower:
-            idx = job_lower.find(pattern)
+    for pattern in REQUIREMENT_PATTERNS:
+        idx = job_lower.find(pattern)
+        if idx != -1:
             start = idx + len(pattern)
             end = min(start + 500, len(job_description))
             requirement_sections.append(job_description[start:end])
 
-    for section in requirement_sections:
-        detected_skills.update(extract_skills(section, all_skills))
+    if requirement_sections:
+        detected_skills.update(extract_skills(_SNIPPET_SEPARATOR.join(requirement_sections), all_skills))
 
+    # The full description and the indicator snippets are scanned on the text lowered above
     if not detected_skills:
-        detected_skills.update(extract_skills(job_description, all_skills))
+        detected_skills.update(_extract_skills_lower(job_lower, all_skills))
 
     if len(detected_skills) < 5:
-        skill_indicators = [
-            'experience with', 'knowledge of', 'fluent in', 'skilled in',
-            'proficiency', 'familiar with', 'expertise in', 'work with', 'proficient in'
-        ]
-        for indicator in skill_indicators:
+        indicator_snippets = []
+        for indicator in SKILL_INDICATORS:
             parts = job_lower.split(indicator)
             for i in range(1, len(parts)):
-                detected_skills.update(extract_skills(parts[i][:150], all_skills))
+                indicator_snippets.append(parts[i][:150])
+        if indicator_snippets:
+            detected_skills.update(_extract_skills_lower(_SNIPPET_SEPARATOR.join(indicator_snippets), all_skills))
 
     detected_role = detect_job_role(job_description)
 
     # Only merge role defaults when this role is in our list. Non-tech roles get ONLY JD-extracted skills.
-    role_defaults = {
-        'Backend Developer': ['Python', 'Django', 'REST API', 'PostgreSQL', 'AWS', 'SQL', 'Git'],
-        'Frontend Developer': ['React', 'JavaScript', 'HTML', 'CSS', 'TypeScript', 'REST API', 'Git'],
-        'Full Stack Developer': ['React', 'Node.js', 'Python', 'SQL', 'AWS', 'Git', 'REST API', 'HTML', 'CSS'],
-        'DevOps Engineer': ['Docker', 'Kubernetes', 'AWS', 'Jenkins', 'Terraform', 'Linux', 'Git', 'CI/CD'],
-        'Cloud Architect': ['AWS', 'Azure', 'Google Cloud', 'Terraform', 'System Design', 'Security', 'Docker'],
-        'Data Scientist': ['Python', 'Machine Learning', 'SQL', 'TensorFlow', 'Pandas', 'Statistics', 'NumPy', 'Data Analysis'],
-        'Data Engineer': ['Python', 'SQL', 'Spark', 'Hadoop', 'AWS', 'ETL', 'Data Pipelines'],
-        'Data Analyst': ['SQL', 'Excel', 'Tableau', 'Python', 'Power BI', 'Data Analysis', 'Statistics'],
-        'QA Engineer': ['TestNG', 'Selenium', 'Automation', 'Java', 'Testing', 'Git', 'CI/CD'],
-        'Security Engineer': ['Linux', 'Cybersecurity', 'AWS', 'Encryption', 'Penetration Testing', 'Security'],
-        'Machine Learning Engineer': ['Python', 'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'SQL', 'Git'],
-        'ML Engineer': ['Python', 'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'SQL'],
-        'Software Engineer': ['Python', 'JavaScript', 'SQL', 'Git', 'REST API', 'Problem Solving'],
-        'Video Editor': ['Premiere Pro', 'After Effects', 'Video Editing', 'Motion Graphics', 'DaVinci Resolve', 'Color Grading'],
-        'Graphic Designer': ['Photoshop', 'Illustrator', 'Graphic Design', 'Figma', 'Canva', 'UI Design'],
-        'Content Writer': ['Content Writing', 'Copywriting', 'SEO', 'Communication'],
-        'Digital Marketing': ['Digital Marketing', 'SEO', 'Social Media Marketing', 'Content Writing', 'Google Analytics', 'Email Marketing'],
-        'Social Media Manager': ['Social Media Marketing', 'Content Writing', 'Communication', 'Canva'],
-        'Product Manager': ['Project Management', 'Communication', 'Problem Solving', 'SQL', 'Data Analysis', 'Agile'],
-        'Project Manager': ['Project Management', 'Communication', 'Leadership', 'Agile', 'Problem Solving'],
-        'Business Analyst': ['SQL', 'Excel', 'Data Analysis', 'Communication', 'Problem Solving'],
-        'Scrum Master': ['Agile', 'Project Management', 'Communication', 'Leadership'],
-        'iOS Developer': ['Swift', 'iOS', 'Git', 'REST API', 'Problem Solving'],
-        'Android Developer': ['Kotlin', 'Java', 'Git', 'REST API', 'Problem Solving'],
-        '.NET Developer': ['C#', 'SQL', 'REST API', 'Git', 'Problem Solving'],
-        'Technical Writer': ['Content Writing', 'Communication', 'Documentation', 'Technical Writing'],
-        'UX Designer': ['UX Design', 'Figma', 'User Research', 'Wireframing', 'Prototyping'],
-        'UI Designer': ['UI Design', 'Figma', 'Photoshop', 'Illustrator', 'Design Systems'],
-        'Motion Graphics Designer': ['After Effects', 'Motion Graphics', 'Premiere Pro', 'Cinematography'],
-        'Video Producer': ['Video Production', 'Premiere Pro', 'Video Editing', 'Project Management'],
-    }
+    role_defaults = ROLE_DEFAULT_SKILLS
 
     if detected_role in role_defaults and len(detected_skills) < 6:
         # Known role and few skills from JD: add that role's defaults so we have a fuller list
@@ -344,20 +432,132 @@ def extract_job_requirements(job_description):
 # MATCHING & SCORING FUNCTIONS
 # ============================================================================
 
+# Normalized requirement sets per job profile, built once at import
+JOB_PROFILE_SKILL_NORMS = {
+    role: {
+        'critical': frozenset(normalize_skill(s) for s in profile['required_skills']['critical']),
+        'all': frozenset(
+            normalize_skill(s)
+            for s in profile['required_skills']['critical'] + profile['required_skills']['required']
+        ),
+    }
+    for role, profile in JOB_PROFILES.items()
+}
+
+
+
+@dataclass(frozen=True, slots=True)
+class JobProfile:
+    """Read-only record view of one JOB_PROFILES entry"""
+    critical: tuple
+    required: tuple
+    min_experience: int
+    education: str
+    salary_avg: int
+
+
+JOB_PROFILE_RECORDS = {
+    role: JobProfile(
+        critical=tuple(profile['required_skills']['critical']),
+        required=tuple(profile['required_skills']['required']),
+        min_experience=profile['min_experience'],
+        education=profile.get('education', 'Bachelor'),
+        salary_avg=profile['salary_2024']['avg'],
+    )
+    for role, profile in JOB_PROFILES.items()
+}
+
+# Role x skill incidence matrices over every normalized profile skill, so all roles
+# are scored against a resume with a couple of matrix-vector products
+JOB_PROFILE_ROLES = tuple(JOB_PROFILE_SKILL_NORMS)
+JOB_PROFILE_SKILL_INDEX = {
+    norm: i for i, norm in enumerate(sorted(set().union(*(n['all'] for n in JOB_PROFILE_SKILL_NORMS.values()))))
+}
+JOB_PROFILE_ALL_MATRIX = np.zeros((len(JOB_PROFILE_ROLES), len(JOB_PROFILE_SKILL_INDEX)))
+JOB_PROFILE_CRITICAL_MATRIX = np.zeros_like(JOB_PROFILE_ALL_MATRIX)
+for _row, _role in enumerate(JOB_PROFILE_ROLES):
+    JOB_PROFILE_ALL_MATRIX[_row, [JOB_PROFILE_SKILL_INDEX[n] for n in JOB_PROFILE_SKILL_NORMS[_role]['all']]] = 1
+    JOB_PROFILE_CRITICAL_MATRIX[_row, [JOB_PROFILE_SKILL_INDEX[n] for n in JOB_PROFILE_SKILL_NORMS[_role]['critical']]] = 1
+del _row, _role
+JOB_PROFILE_ALL_SIZES = JOB_PROFILE_ALL_MATRIX.sum(axis=1)
+JOB_PROFILE_CRITICAL_SIZES = JOB_PROFILE_CRITICAL_MATRIX.sum(axis=1)
+# Eligibility uses the length of the critical list as written in the profile
+JOB_PROFILE_CRITICAL_TOTALS = np.array(
+    [len(JOB_PROFILE_RECORDS[role].critical) for role in JOB_PROFILE_ROLES], dtype=float
+)
+
+ELIGIBILITY_COLORS = {
+    "Excellent Match": "🟢",
+    "Good Match": "🟡",
+    "Potential Match": "🟠",
+    "Learning Required": "🔴",
+}
+
+
+def score_job_profiles(resume_norm_counts):
+    """
+    Score every job profile against a Counter of normalized resume skills.
+    Returns per-role lists (in JOB_PROFILE_ROLES order): match_score, critical_missing,
+    critical_matched and eligibility.
+    """
+    counts = np.zeros(len(JOB_PROFILE_SKILL_INDEX))
+    for norm, count in resume_norm_counts.items():
+        col = JOB_PROFILE_SKILL_INDEX.get(norm)
+        if col is not None:
+            counts[col] = count
+    present = (counts > 0).astype(float)
+
+    # Same percentage as calculate_match; critical matches count every resume spelling
+    raw_scores = JOB_PROFILE_ALL_MATRIX @ present / JOB_PROFILE_ALL_SIZES * 100
+    match_scores = np.array([round(x, 2) for x in raw_scores.tolist()])
+    critical_matched = JOB_PROFILE_CRITICAL_MATRIX @ counts
+    critical_missing = JOB_PROFILE_CRITICAL_SIZES - JOB_PROFILE_CRITICAL_MATRIX @ present
+    critical_pct = np.divide(
+        critical_matched, JOB_PROFILE_CRITICAL_TOTALS,
+        out=np.zeros_like(critical_matched), where=JOB_PROFILE_CRITICAL_TOTALS > 0
+    ) * 100
+
+    eligibility = np.select(
+        [
+            (critical_pct >= 80) & (match_scores >= 70),
+            (critical_pct >= 60) & (match_scores >= 55),
+            (critical_pct >= 40) & (match_scores >= 40),
+        ],
+        ["Excellent Match", "Good Match", "Potential Match"],
+        "Learning Required",
+    )
+    return {
+        'match_score': match_scores.tolist(),
+        'critical_missing': critical_missing.astype(int).tolist(),
+        'critical_matched': critical_matched.astype(int).tolist(),
+        'eligibility': eligibility.tolist(),
+    }
+
+
 def calculate_match(resume_skills, job_requirements):
     """
     Calculate precise skill match percentage.
     Returns (match_percentage, matched_skills_list, missing_skills_list)
     """
+    return calculate_match_with_technical(resume_skills, job_requirements)[:3]
+
+
+def calculate_match_with_technical(resume_skills, job_requirements):
+    """
+    calculate_match that also partitions out the technical skills in the same pass.
+    Returns (match_percentage, matched, missing, matched_technical, missing_technical)
+    """
     if isinstance(job_requirements, str):
         required_skills = extract_skills(job_requirements)
     else:
         required_skills = list(job_requirements)
     
     if not required_skills:
-        return 0, [], []
+        return 0, [], [], [], []
     
-    resume_set = set(normalize_skill(s) for s in resume_skills)
+    # Normalize each resume skill once; the casing pass below reuses the same names
+    resume_norms = [normalize_skill(s) for s in resume_skills]
+    resume_set = set(resume_norms)
     required_set = set(normalize_skill(s) for s in required_skills)
     
     matched = resume_set & required_set
@@ -366,9 +566,22 @@ def calculate_match(resume_skills, job_requirements):
     match_percentage = (len(matched) / len(required_set)) * 100 if required_set else 0
     
     # Return with original casing
-    matched_with_case = [s for s in resume_skills if normalize_skill(s) in matched]
+    matched_with_case = []
+    matched_technical = []
+    for s, skill_norm in zip(resume_skills, resume_norms):
+        if skill_norm in matched:
+            matched_with_case.append(s)
+            if _is_technical_norm(skill_norm):
+                matched_technical.append(s)
+    missing = list(missing)
+    missing_technical = [s for s in missing if _is_technical_norm(s)]
     
-    return round(match_percentage, 2), matched_with_case, list(missing)
+    return round(match_percentage, 2), matched_with_case, missing, matched_technical, missing_technical
+
+
+# Per-skill match weights: base 10 points + industry multiplier, precomputed once
+DEFAULT_SKILL_WEIGHT = (1.0 + 1.0) * 10
+SKILL_WEIGHTS = {skill: (1.0 + multiplier) * 10 for skill, multiplier in SKILL_MULTIPLIERS.items()}
 
 
 def calculate_weighted_match_score(resume_skills, job_requirements):
@@ -384,16 +597,13 @@ def calculate_weighted_match_score(resume_skills, job_requirements):
     if not required_skills:
         return 0
     
-    resume_norm = {normalize_skill(s): s for s in resume_skills}
+    resume_norm = set(normalize_skill(s) for s in resume_skills)
     total_weight = 0
     matched_weight = 0
     
     for req_skill in required_skills:
         req_norm = normalize_skill(req_skill)
-        
-        # Get multiplier for this skill
-        multiplier = SKILL_MULTIPLIERS.get(req_norm, 1.0)
-        weight = (1.0 + multiplier) * 10  # Base 10 points + multiplier
+        weight = SKILL_WEIGHTS.get(req_norm, DEFAULT_SKILL_WEIGHT)
         
         total_weight += weight
         
@@ -410,6 +620,21 @@ def calculate_weighted_match_score(resume_skills, job_requirements):
 # RESUME QUALITY ANALYSIS
 # ============================================================================
 
+# Rubric keyword lists, lowercased once for the counters below
+RUBRIC_ACTION_VERBS = tuple(verb.lower() for verb in QUALITY_RUBRIC['action_verbs']['verbs'])
+RUBRIC_METRIC_KEYWORDS = tuple(QUALITY_RUBRIC['quantification']['metric_verbs'])
+
+
+def count_action_verbs(text_lower):
+    """Count rubric action-verb occurrences in already-lowercased text."""
+    return sum(text_lower.count(verb) for verb in RUBRIC_ACTION_VERBS)
+
+
+def count_metric_keywords(resume_text):
+    """Count quantification keywords (increased, %, $, ...) in the resume text."""
+    return sum(resume_text.count(keyword) for keyword in RUBRIC_METRIC_KEYWORDS)
+
+
 def analyze_resume_quality(resume_text, resume_skills, experience, education):
     """
     Comprehensive resume quality scoring using industry rubric.
@@ -417,7 +642,12 @@ def analyze_resume_quality(resume_text, resume_skills, experience, education):
     """
     if not resume_text or not isinstance(resume_text, str):
         return 0, ["Resume text is empty"], {}
-    
+    return _resume_quality(resume_text, resume_text.lower(), resume_skills, experience, education,
+                           extract_contact_info(resume_text))
+
+
+def _resume_quality(resume_text, text_lower, resume_skills, experience, education, contact_info):
+    """analyze_resume_quality with the lowercased text and contact info supplied by the caller."""
     total_score = 0
     issues = []
     analysis = {}
@@ -486,7 +716,6 @@ def analyze_resume_quality(resume_text, resume_skills, experience, education):
         issues.append("Mention your educational background")
     
     # 5. CONTACT INFORMATION (10 points)
-    contact_info = extract_contact_info(resume_text)
     contact_found = sum(1 for v in contact_info.values() if v)
     
     if contact_found >= 3:
@@ -507,7 +736,7 @@ def analyze_resume_quality(resume_text, resume_skills, experience, education):
     required_sections = QUALITY_RUBRIC['sections']['required']
     found_sections = []
     for section in required_sections:
-        if section.lower() in resume_text.lower():
+        if section.lower() in text_lower:
             found_sections.append(section)
     
     if len(found_sections) >= 3:
@@ -524,8 +753,7 @@ def analyze_resume_quality(resume_text, resume_skills, experience, education):
         issues.append("Include Experience, Education, and Skills sections")
     
     # 7. ACTION VERBS (10 points)
-    verbs = QUALITY_RUBRIC['action_verbs']['verbs']
-    verb_count = sum(resume_text.lower().count(verb.lower()) for verb in verbs)
+    verb_count = count_action_verbs(text_lower)
     
     if verb_count >= 8:
         total_score += 10
@@ -542,8 +770,7 @@ def analyze_resume_quality(resume_text, resume_skills, experience, education):
         issues.append("Start bullet points with strong action verbs")
     
     # 8. QUANTIFICATION (5 points)
-    metric_keywords = QUALITY_RUBRIC['quantification']['metric_verbs']
-    metrics_found = sum(resume_text.count(keyword) for keyword in metric_keywords)
+    metrics_found = count_metric_keywords(resume_text)
     
     if metrics_found >= 5:
         total_score += 5
@@ -561,6 +788,32 @@ def analyze_resume_quality(resume_text, resume_skills, experience, education):
     return round(final_score, 1), issues, analysis
 
 
+def analyze_resume(resume_text, skills=None):
+    """
+    Extract skills, experience, education, contact info and quality in one pass.
+    The text is lowercased and the contact patterns are searched once, then shared.
+    """
+    if not isinstance(resume_text, str):
+        resume_text = ''
+    text_lower = resume_text.lower()
+    # Same empty-text results as extract_skills and analyze_resume_quality
+    resume_skills = _extract_skills_lower(text_lower, skills) if resume_text else []
+    experience = extract_experience(resume_text)
+    education = _education_from_lower(text_lower)
+    contact_info = extract_contact_info(resume_text)
+    if not resume_text:
+        quality = (0, ["Resume text is empty"], {})
+    else:
+        quality = _resume_quality(resume_text, text_lower, resume_skills, experience, education, contact_info)
+    return {
+        'resume_skills': resume_skills,
+        'experience': experience,
+        'education': education,
+        'contact_info': contact_info,
+        'quality': quality,
+    }
+
+
 # ============================================================================
 # SALARY PREDICTION
 # ============================================================================
@@ -581,8 +834,8 @@ def predict_salary(experience_years, resume_skills, education, industry='Tech'):
     
     exp = min(exp, 30)  # Cap at 30 years for realistic calculation
     
-    # Get industry salary data
-    industry_data = INDUSTRY_SALARY_DATA.get(industry, INDUSTRY_SALARY_DATA['Tech'])
+    if industry not in INDUSTRY_SALARY_DATA:
+        industry = 'Tech'
     
     # Determine level
     if exp < 2:
@@ -596,7 +849,7 @@ def predict_salary(experience_years, resume_skills, education, industry='Tech'):
     else:
         level = 'Staff+'
     
-    base_salary = industry_data.get(level, industry_data['Mid-Level'])
+    base_min, base_avg, base_max = SALARY_BANDS[(industry, level)]
     
     # Calculate skill multiplier
     skill_multiplier = 1.0
@@ -623,9 +876,9 @@ def predict_salary(experience_years, resume_skills, education, industry='Tech'):
     # Calculate final salary
     total_mult = skill_multiplier * education_mult * exp_mult
     
-    min_sal = base_salary['min'] * total_mult
-    avg_sal = base_salary['avg'] * total_mult
-    max_sal = base_salary['max'] * total_mult
+    min_sal = base_min * total_mult
+    avg_sal = base_avg * total_mult
+    max_sal = base_max * total_mult
     
     return {
         'min': round(max(35, min_sal), 0),
@@ -651,16 +904,16 @@ def get_skill_gaps(resume_skills, job_requirements):
     resume_norm = {normalize_skill(s) for s in resume_skills}
     required_norm = {normalize_skill(s) for s in required}
     missing = required_norm - resume_norm
-    tech_norm = {normalize_skill(s) for s in TECHNICAL_SKILLS.keys()}
     default_resources = ['Udemy', 'Coursera', 'Official documentation', 'Hands-on projects']
 
+    # Only the first eight gaps are returned, so only those are built
     gaps = []
-    for skill in sorted(missing):
+    for skill in sorted(missing)[:8]:
         display_name = skill.title()
         path = LEARNING_PATHS.get(display_name, {})
         skill_data = TECHNICAL_SKILLS.get(display_name, {})
 
-        if skill in tech_norm:
+        if skill in TECHNICAL_SKILL_NORMS:
             priority = 'Critical' if skill in SKILL_MULTIPLIERS else 'High'
             timeline = path.get('timeline', '6-12 weeks')
             resources = path.get('entry', []) or default_resources
@@ -683,7 +936,7 @@ def get_skill_gaps(resume_skills, job_requirements):
             'growth': growth
         })
 
-    return gaps[:8]
+    return gaps
 
 
 def get_interview_readiness_score(resume_skills, job_requirements, experience, education):
@@ -835,6 +1088,19 @@ def get_career_progression_path(experience_years, resume_skills, job_description
     return paths[:3]
 
 
+def score_resume_quality(resume_text, resume_skills):
+    """Quality score of a resume, detecting experience and education from its text."""
+    if not resume_text or not isinstance(resume_text, str):
+        return 0
+    experience = extract_experience(resume_text)
+    # Education and the rubric checks share one lowercased copy of the text
+    text_lower = resume_text.lower()
+    return _resume_quality(
+        resume_text, text_lower, resume_skills, experience, _education_from_lower(text_lower),
+        extract_contact_info(resume_text)
+    )[0]
+
+
 # ============================================================================
 # RECOMMENDATIONS & ANALYSIS
 # ============================================================================
@@ -1316,9 +1582,10 @@ def match_job_profile(resume_skills, job_description):
     best_match = None
     best_score = 0
 
-    for role, profile in JOB_PROFILES.items():
-        required = profile['required_skills']['critical'] + profile['required_skills']['required']
-        score, _, _ = calculate_match(resume_skills, required)
+    resume_set = set(normalize_skill(s) for s in resume_skills)
+    for role, norms in JOB_PROFILE_SKILL_NORMS.items():
+        required_set = norms['all']
+        score = round((len(resume_set & required_set) / len(required_set)) * 100, 2)
 
         if score > best_score:
             best_score = score
@@ -1338,9 +1605,15 @@ def get_keyword_density(resume_text, job_skills):
     text_lower = resume_text.lower()
     found = []
     missing = []
+    # Job skills repeat spellings and share aliases, so each distinct term is counted once
+    term_counts = {}
     for skill in job_skills:
         sn = normalize_skill(skill)
-        count = text_lower.count(sn) + sum(text_lower.count(a) for a in expand_skill_with_aliases(skill) if a != sn)
+        count = 0
+        for term in (sn,) + tuple(a for a in _skill_aliases(sn) if a != sn):
+            if term not in term_counts:
+                term_counts[term] = text_lower.count(term)
+            count += term_counts[term]
         if count > 0:
             found.append((skill, count))
         else:
@@ -1353,18 +1626,18 @@ def get_ats_checklist(resume_text, resume_skills, experience, education):
     """Return ATS-friendly checklist: item, status (pass/warn/fail), tip."""
     contact = extract_contact_info(resume_text)
     contact_count = sum(1 for v in contact.values() if v)
+    text_lower = resume_text.lower()
     sections_required = ['experience', 'education', 'skills']
-    found_sections = [s for s in sections_required if s in resume_text.lower()]
-    verbs = QUALITY_RUBRIC['action_verbs']['verbs']
-    verb_count = sum(resume_text.lower().count(v.lower()) for v in verbs)
+    found_sections = [s for s in sections_required if s in text_lower]
+    verb_count = count_action_verbs(text_lower)
     char_count = len(resume_text)
     word_count = len(resume_text.split())
 
     checklist = [
         {'item': 'Contact info (email, phone, LinkedIn)', 'status': 'pass' if contact_count >= 2 else 'warn' if contact_count >= 1 else 'fail', 'tip': 'Add email, phone, and LinkedIn URL.'},
-        {'item': 'Experience section', 'status': 'pass' if 'experience' in resume_text.lower() else 'fail', 'tip': 'Include a clear Experience or Work History section.'},
-        {'item': 'Education section', 'status': 'pass' if 'education' in resume_text.lower() else 'fail', 'tip': 'Include Education with degree and institution.'},
-        {'item': 'Skills section', 'status': 'pass' if 'skills' in resume_text.lower() else 'fail', 'tip': 'List technical and soft skills clearly.'},
+        {'item': 'Experience section', 'status': 'pass' if 'experience' in text_lower else 'fail', 'tip': 'Include a clear Experience or Work History section.'},
+        {'item': 'Education section', 'status': 'pass' if 'education' in text_lower else 'fail', 'tip': 'Include Education with degree and institution.'},
+        {'item': 'Skills section', 'status': 'pass' if 'skills' in text_lower else 'fail', 'tip': 'List technical and soft skills clearly.'},
         {'item': 'Length (400–1500 words)', 'status': 'pass' if 400 <= word_count <= 1500 else 'warn' if 200 <= word_count < 400 or word_count > 2000 else 'fail', 'tip': 'Ideal: 1–2 pages, 400–800 words.'},
         {'item': 'Action verbs (5+)', 'status': 'pass' if verb_count >= 5 else 'warn' if verb_count >= 2 else 'fail', 'tip': 'Start bullets with Led, Developed, Implemented, etc.'},
         {'item': 'Skills count (8+)', 'status': 'pass' if len(resume_skills) >= 8 else 'warn' if len(resume_skills) >= 5 else 'fail', 'tip': 'List 8–15 relevant skills.'},
@@ -1391,14 +1664,22 @@ def get_readability_stats(resume_text):
     return {'word_count': word_count, 'char_count': char_count, 'reading_time_mins': reading_time_mins, 'length_ok': length_ok, 'suggestion': suggestion}
 
 
+# Verb lists for get_action_verb_suggestions, with lowercase forms precomputed
+STRONG_ACTION_VERBS = (
+    'Led', 'Developed', 'Managed', 'Created', 'Implemented', 'Designed', 'Built', 'Improved',
+    'Achieved', 'Optimized', 'Launched', 'Established', 'Reduced', 'Increased', 'Automated'
+)
+_STRONG_ACTION_VERBS_LOWER = tuple((verb, verb.lower()) for verb in STRONG_ACTION_VERBS)
+WEAK_VERBS = ('did', 'made', 'worked', 'helped', 'used', 'responsible for', 'handled')
+SUGGESTED_ACTION_VERBS = ('Led', 'Developed', 'Implemented', 'Designed', 'Achieved', 'Optimized')
+
+
 def get_action_verb_suggestions(resume_text):
     """Count action verbs and suggest stronger alternatives."""
-    verbs_strong = ['Led', 'Developed', 'Managed', 'Created', 'Implemented', 'Designed', 'Built', 'Improved', 'Achieved', 'Optimized', 'Launched', 'Established', 'Reduced', 'Increased', 'Automated']
-    weak = ['did', 'made', 'worked', 'helped', 'used', 'responsible for', 'handled']
     text_lower = resume_text.lower()
-    used = [v for v in verbs_strong if v.lower() in text_lower]
-    weak_found = [w for w in weak if w in text_lower]
-    suggested = ['Led', 'Developed', 'Implemented', 'Designed', 'Achieved', 'Optimized'] if not used else []
+    used = [verb for verb, verb_lower in _STRONG_ACTION_VERBS_LOWER if verb_lower in text_lower]
+    weak_found = [w for w in WEAK_VERBS if w in text_lower]
+    suggested = list(SUGGESTED_ACTION_VERBS) if not used else []
     return {'count': len(used), 'used': used[:10], 'weak_found': weak_found, 'suggested_add': suggested[:5]}
 
 
@@ -1448,13 +1729,13 @@ def get_cover_letter_bullets(resume_skills, job_skills, experience, job_role):
 
 def get_ideal_candidate_snapshot(job_role):
     """Return short bullet list of what an ideal resume has for this role."""
-    profile = JOB_PROFILES.get(job_role)
+    profile = JOB_PROFILE_RECORDS.get(job_role)
     if not profile:
         return ["Strong technical skills matching the job description", "Clear experience section", "Relevant education and certifications"]
-    critical = profile['required_skills']['critical'][:5]
-    required = profile['required_skills']['required'][:3]
-    min_exp = profile['min_experience']
-    edu = profile.get('education', 'Bachelor')
+    critical = profile.critical[:5]
+    required = profile.required[:3]
+    min_exp = profile.min_experience
+    edu = profile.education
     bullets = [f"Key skills: {', '.join(critical)}"]
     bullets.append(f"Also: {', '.join(required)}")
     bullets.append(f"Experience: {min_exp}+ years")